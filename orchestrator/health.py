@@ -2,6 +2,7 @@
 Health Aggregator - Collects status from all monitors and manages alerts.
 """
 
+import asyncio
 import logging
 from typing import Optional
 from monitors import BaseMonitor, VPSMonitor, OBSMonitor, AgentMonitor, UnityMonitor
@@ -57,16 +58,20 @@ class HealthAggregator:
         Returns:
             Dict mapping monitor name to status dict
         """
-        statuses = {}
-        for name, monitor in self.monitors.items():
-            try:
-                logger.debug(f"[HEALTH] Checking {name}...")
-                statuses[name] = monitor.get_status()
-                logger.debug(f"[HEALTH] {name} done")
-            except Exception as e:
-                logger.error(f"Error getting status from {name}: {e}")
-                statuses[name] = {'healthy': False, 'error': str(e)}
-        return statuses
+        return {name: self._monitor_status(name) for name in self.monitors}
+
+    def _monitor_status(self, name: str) -> dict:
+        """Probe one monitor; errors become an unhealthy status instead of raising."""
+        monitor = self.monitors[name]
+        try:
+            logger.debug(f"[HEALTH] Checking {name}...")
+            with monitor.lock:
+                status = monitor.get_status()
+            logger.debug(f"[HEALTH] {name} done")
+            return status
+        except Exception as e:
+            logger.error(f"Error getting status from {name}: {e}")
+            return {'healthy': False, 'error': str(e)}
 
     def get_all_alerts(self) -> list[str]:
         """
@@ -78,12 +83,39 @@ class HealthAggregator:
         alerts = []
         for name, monitor in self.monitors.items():
             try:
-                monitor_alerts = monitor.get_alerts()
+                with monitor.lock:
+                    monitor_alerts = monitor.get_alerts()
                 alerts.extend(monitor_alerts)
             except Exception as e:
                 logger.error(f"Error getting alerts from {name}: {e}")
         return alerts
 
+    async def get_all_status_async(self) -> dict:
+        """
+        Async get_all_status - monitors are probed concurrently in worker threads,
+        so a cycle takes as long as the slowest monitor, not the sum.
+        """
+        names = list(self.monitors)
+        statuses = await asyncio.gather(
+            *(asyncio.to_thread(self._monitor_status, name) for name in names)
+        )
+        return dict(zip(names, statuses))
+
+    async def get_all_alerts_async(self) -> list[str]:
+        """Async get_all_alerts - runs in a worker thread, off the event loop."""
+        return await asyncio.to_thread(self.get_all_alerts)
+
+    def get_status_line(self, name: str, status: Optional[dict] = None) -> str:
+        """
+        Get one monitor's status line, serialized against other probes of it.
+
+        Pass a status from get_all_status() to format it without probing again.
+        Raises whatever the monitor raises - callers decide how to render errors.
+        """
+        monitor = self.monitors[name]
+        with monitor.lock:
+            return monitor.get_status_line(status)
+
     def get_status_summary(self) -> str:
         """
         Get a formatted status summary for Claude's context.
@@ -95,7 +127,8 @@ class HealthAggregator:
 
         for name, monitor in self.monitors.items():
             try:
-                lines.append(f"- {monitor.get_status_line()}")
+                with monitor.lock:
+                    lines.append(f"- {monitor.get_status_line()}")
             except Exception as e:
                 lines.append(f"- {name}: error ({e})")
 
@@ -115,7 +148,8 @@ class HealthAggregator:
         """Check if all monitors report healthy."""
         for name, monitor in self.monitors.items():
             try:
-                status = monitor.get_status()
+                with monitor.lock:
+                    status = monitor.get_status()
                 if not status.get('healthy', True):
                     return False
             except Exception:
@@ -12,23 +12,62 @@ Architecture:
 """
 
 import asyncio
+import atexit
+import concurrent.futures
+import hashlib
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import shutil
 import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from collections import defaultdict, deque
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, NamedTuple, Optional
 
 import requests
 import yaml
 
+# libyaml C loader when PyYAML was built with it, pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    HAS_LIBYAML = False
+
+# libuv event loop - faster subprocess/pipe transports; not available on Windows
+try:
+    if os.name == 'nt':
+        raise ImportError
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+# Filesystem events for libsignal temp folder cleanup (Windows)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
+# Fast JSON serialization; stdlib json is the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # =============================================================================
 # Async Subprocess Helper
@@ -92,6 +131,35 @@ async def run_subprocess_async(
         raise
 
 
+# =============================================================================
+# JSON Parsing
+# =============================================================================
+
+# One decoder shared by every parse site (signal-cli lines, Claude output),
+# used when orjson isn't available
+_JSON_DECODER = json.JSONDecoder()
+
+
+def parse_json(data: str | bytes):
+    """
+    Parse a JSON document (str or UTF-8 bytes). Raises json.JSONDecodeError on bad input.
+
+    Uses orjson when installed (its JSONDecodeError subclasses json's).
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return _JSON_DECODER.decode(data)
+
+
+def dump_json_bytes(data) -> bytes:
+    """Serialize to UTF-8 JSON bytes in one shot (orjson when installed)."""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
 # =============================================================================
 # Response Style (included in all prompts)
 # =============================================================================
@@ -102,20 +170,79 @@ async def run_subprocess_async(
 _openrouter_api_key: Optional[str] = None
 
 
+# Shared HTTP session - keeps the TLS connection to openrouter.ai alive
+# between balance refreshes instead of a fresh handshake each time
+_http = requests.Session()
+_http.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Balance cache - every outgoing message checks for low balance, so don't hit
+# the API each time. Errors are cached too, so an outage doesn't stall sends.
+_BALANCE_TTL = 120
+_balance_cache = {'value': None, 'ts': float('-inf')}
+_balance_refreshing = threading.Lock()  # Held while a background refresh runs
+
+
 def check_openrouter_balance() -> Optional[float]:
-    """Check OpenRouter credit balance. Returns remaining credits or None on error."""
+    """
+    Check OpenRouter credit balance. Returns remaining credits or None on error.
+
+    Cached for _BALANCE_TTL seconds. Blocking on refresh - async callers
+    should use get_openrouter_balance().
+    """
+    if time.monotonic() - _balance_cache['ts'] < _BALANCE_TTL:
+        return _balance_cache['value']
+
     # Use module-level key (from config) or env var
     api_key = _openrouter_api_key or os.environ.get('OPENROUTER_API_KEY')
     if not api_key:
         logger.debug("[OPENROUTER] No API key configured")
-        return None
+        balance = None  # Cached like any other result - no key, no lookups
+    else:
+        balance = _fetch_openrouter_balance(api_key)
+    _balance_cache['value'] = balance
+    _balance_cache['ts'] = time.monotonic()
+    if balance is not None:
+        logger.info(f"[BALANCE] OpenRouter: ${balance:.2f}")
+    return balance
+
+
+async def get_openrouter_balance() -> Optional[float]:
+    """
+    Cached OpenRouter balance; refreshes run in a worker thread, off the event loop.
+
+    Only the very first call waits for the API. After that a stale value is
+    returned at once while one background refresh updates it, so sends never
+    wait on HTTP.
+    """
+    if time.monotonic() - _balance_cache['ts'] < _BALANCE_TTL:
+        return _balance_cache['value']
+    if _balance_cache['ts'] == float('-inf'):
+        return await asyncio.to_thread(check_openrouter_balance)
+
+    if _balance_refreshing.acquire(blocking=False):
+        try:
+            asyncio.get_running_loop().run_in_executor(None, _refresh_openrouter_balance)
+        except RuntimeError:  # Executor shut down - we're exiting
+            _balance_refreshing.release()
+    return _balance_cache['value']
+
 
+def _refresh_openrouter_balance():
+    """Background refresh for get_openrouter_balance (holds _balance_refreshing)."""
+    try:
+        check_openrouter_balance()
+    finally:
+        _balance_refreshing.release()
+
+
+def _fetch_openrouter_balance(api_key: str) -> Optional[float]:
+    """Query the OpenRouter credits endpoint (uncached, blocking)."""
     # Log key format for debugging (first 10 chars only)
     key_preview = api_key[:10] + "..." if len(api_key) > 10 else api_key
     logger.debug(f"[OPENROUTER] Using key: {key_preview}")
 
     try:
-        resp = requests.get(
+        resp = _http.get(
             'https://openrouter.ai/api/v1/credits',
             headers={'Authorization': f'Bearer {api_key}'},
             timeout=(2, 5)
@@ -132,21 +259,37 @@ def check_openrouter_balance() -> Optional[float]:
     return None
 
 
-def strip_markdown(text: str) -> str:
-    """Remove markdown formatting for plain text output."""
+# Applied in order - later patterns see the output of earlier ones, so nested
+# markers like **_text_** are fully stripped
+_MARKDOWN_PATTERNS = [
     # Bold: **text** or __text__
-    text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-    text = re.sub(r'__(.+?)__', r'\1', text)
+    (re.compile(r'\*\*(.+?)\*\*'), r'\1'),
+    (re.compile(r'__(.+?)__'), r'\1'),
     # Italic: *text* or _text_
-    text = re.sub(r'\*(.+?)\*', r'\1', text)
-    text = re.sub(r'(?<!\w)_(.+?)_(?!\w)', r'\1', text)
+    (re.compile(r'\*(.+?)\*'), r'\1'),
+    (re.compile(r'(?<!\w)_(.+?)_(?!\w)'), r'\1'),
     # Code: `text`
-    text = re.sub(r'`(.+?)`', r'\1', text)
+    (re.compile(r'`(.+?)`'), r'\1'),
     # Headers: ### text
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    (re.compile(r'^#{1,6}\s+', re.MULTILINE), ''),
+]
+
+
+def strip_markdown(text: str) -> str:
+    """Remove markdown formatting for plain text output."""
+    # Plain text (no marker characters at all) needs no regex passes
+    if not any(c in text for c in '*_`#'):
+        return text
+    for pattern, repl in _MARKDOWN_PATTERNS:
+        text = pattern.sub(repl, text)
     return text
 
 
+def bullet_join(items: list[str]) -> str:
+    """Render items as a markdown bullet list ("" for none) in a single join."""
+    return "- " + "\n- ".join(items) if items else ""
+
+
 # =============================================================================
 # Temp Folder Cleanup (libsignal leak prevention)
 # =============================================================================
@@ -155,8 +298,54 @@ def strip_markdown(text: str) -> str:
 # This is very specific to avoid accidentally matching anything else
 LIBSIGNAL_PATTERN = re.compile(r'^libsignal\d+$')
 
+# Folders younger than this may still be in use and are never deleted
+LIBSIGNAL_MAX_AGE = 300
+
+
+def _libsignal_search_paths(temp_dir: Path) -> list[Path]:
+    """TEMP and one level of numeric subdirs (folders appeared in TEMP\\2\\ on VPS)."""
+    search_paths = [temp_dir]
+    try:
+        # scandir: DirEntry caches the type from the directory listing - no stat per entry
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                if entry.name.isdigit() and entry.is_dir(follow_symlinks=False):
+                    search_paths.append(Path(entry.path))
+    except Exception:
+        pass  # Permission issues reading temp dir
+    return search_paths
+
+
+def watch_libsignal_temp_folders(on_created) -> Optional["Observer"]:
+    """
+    Watch the temp dirs for new libsignal folders (Windows only).
+
+    Calls on_created() from the watchdog thread whenever one appears, so the
+    cleanup loop can react instead of polling. Returns the started observer,
+    or None if watching isn't available (non-Windows, watchdog not installed).
+    """
+    if sys.platform != 'win32' or not HAS_WATCHDOG:
+        return None
+
+    class _Handler(FileSystemEventHandler):
+        def on_created(self, event):
+            if event.is_directory and LIBSIGNAL_PATTERN.match(Path(event.src_path).name):
+                on_created()
+
+    try:
+        observer = Observer()
+        handler = _Handler()
+        for path in _libsignal_search_paths(Path(tempfile.gettempdir())):
+            observer.schedule(handler, str(path), recursive=False)
+        observer.daemon = True
+        observer.start()
+        return observer
+    except Exception as e:
+        logger.debug(f"[CLEANUP] Could not watch temp dir: {e}")
+        return None
 
-def cleanup_libsignal_temp_folders(max_age_seconds: int = 300) -> dict:
+
+def cleanup_libsignal_temp_folders(max_age_seconds: int = LIBSIGNAL_MAX_AGE) -> dict:
     """
     Clean up orphaned libsignal temp folders on Windows.
 
@@ -192,48 +381,41 @@ def cleanup_libsignal_temp_folders(max_age_seconds: int = 300) -> dict:
     now = time.time()
     folders_found = []
 
-    # Search TEMP and one level of subdirs (folders appeared in TEMP\2\ on VPS)
-    search_paths = [temp_dir]
-    try:
-        for subdir in temp_dir.iterdir():
-            if subdir.is_dir() and subdir.name.isdigit():
-                search_paths.append(subdir)
-    except Exception:
-        pass  # Permission issues reading temp dir
-
-    for search_path in search_paths:
+    for search_path in _libsignal_search_paths(temp_dir):
         try:
-            for item in search_path.iterdir():
-                if not item.is_dir():
-                    continue
-
-                # CRITICAL: Only match exact pattern "libsignal" + digits
-                if not LIBSIGNAL_PATTERN.match(item.name):
-                    continue
+            with os.scandir(search_path) as entries:
+                for entry in entries:
+                    # CRITICAL: Only match exact pattern "libsignal" + digits.
+                    # Prefix check first - TEMP is mostly unrelated entries
+                    name = entry.name
+                    if not name.startswith('libsignal') or not LIBSIGNAL_PATTERN.match(name):
+                        continue
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
 
-                result['checked'] += 1
-                folders_found.append(item)
+                    result['checked'] += 1
+                    folders_found.append(entry.name)
 
-                # Check age
-                try:
-                    mtime = item.stat().st_mtime
-                    age_seconds = now - mtime
+                    # Check age
+                    try:
+                        mtime = entry.stat(follow_symlinks=False).st_mtime
+                        age_seconds = now - mtime
 
-                    if age_seconds < max_age_seconds:
-                        # Too recent - might be in use, skip
-                        continue
+                        if age_seconds < max_age_seconds:
+                            # Too recent - might be in use, skip
+                            continue
 
-                    # Safe to delete - old enough
-                    shutil.rmtree(item, ignore_errors=False)
-                    result['deleted'] += 1
-                    logger.info(f"[CLEANUP] Deleted old libsignal folder: {item.name} (age: {int(age_seconds)}s)")
+                        # Safe to delete - old enough
+                        shutil.rmtree(entry.path, ignore_errors=False)
+                        result['deleted'] += 1
+                        logger.info(f"[CLEANUP] Deleted old libsignal folder: {entry.name} (age: {int(age_seconds)}s)")
 
-                except PermissionError:
-                    # Folder is locked (DLL in use) - this is expected, skip silently
-                    result['failed'] += 1
-                except Exception as e:
-                    result['failed'] += 1
-                    logger.debug(f"[CLEANUP] Could not delete {item.name}: {e}")
+                    except PermissionError:
+                        # Folder is locked (DLL in use) - this is expected, skip silently
+                        result['failed'] += 1
+                    except Exception as e:
+                        result['failed'] += 1
+                        logger.debug(f"[CLEANUP] Could not delete {entry.name}: {e}")
 
         except Exception as e:
             logger.debug(f"[CLEANUP] Error scanning {search_path}: {e}")
@@ -254,34 +436,297 @@ from health import HealthAggregator
 from memory import MemoryManager
 from smart_monitoring import SmartMonitor
 
-# Configure logging - DEBUG level shows poll details
+# Configure logging - DEBUG level shows poll details.
+# Importers (tests, scripts) log straight to stdout. main() switches to a queue,
+# with a listener thread doing the timestamp formatting and the (possibly slow)
+# stdout write, keeping both off the event loop.
 log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
+_log_output = logging.StreamHandler(sys.stdout)
+_log_output.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=getattr(logging, log_level, logging.INFO),
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
+    handlers=[_log_output]
 )
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+_log_input = logging.handlers.QueueHandler(_log_queue)
+# prepare() bakes the handler's format into the record; keep it to the bare
+# message, or _log_output's format ends up nested inside itself
+_log_input.setFormatter(logging.Formatter('%(message)s'))
+_log_listener_lock = threading.Lock()
+_log_listener_running = False
 logger = logging.getLogger(__name__)
 
 
+def _start_log_listener():
+    """Route logging through the queue and its listener thread (called from main())."""
+    global _log_listener_running
+    with _log_listener_lock:
+        if _log_listener_running:
+            return
+        root = logging.getLogger()
+        root.removeHandler(_log_output)
+        root.addHandler(_log_input)
+        _log_listener.start()
+        _log_listener_running = True
+    atexit.register(_stop_log_listener)
+
+
+def _stop_log_listener():
+    """Flush queued records and go back to direct output. Safe to call twice, from any thread."""
+    global _log_listener_running
+    with _log_listener_lock:
+        if not _log_listener_running:
+            return
+        root = logging.getLogger()
+        root.removeHandler(_log_input)
+        root.addHandler(_log_output)
+        _log_listener.stop()  # Writes out everything still queued
+        _log_listener_running = False
+
+
 # =============================================================================
 # Signal Client
 # =============================================================================
 
+class ParsedMessage(NamedTuple):
+    """Fields pulled out of one signal-cli envelope, so later passes don't re-walk the dict tree."""
+    timestamp: Optional[int]
+    group_id: Optional[str]
+    sender: Optional[str]
+    text: Optional[str]
+    mentions: list
+
+
 class SignalCLINative:
     """Native signal-cli client."""
 
+    # Sends queued within this window are coalesced into one signal-cli call per group
+    SEND_BATCH_WINDOW = 0.05
+    MAX_MESSAGE_LENGTH = 4000
+
+    # Streaming mode: how long receive_messages waits for the first message,
+    # and how long to wait before restarting a signal-cli that exited
+    RECEIVE_WAIT = 15
+    STREAM_RESTART_DELAY = 5.0
+
+    # Give up on streaming (fall back to polling) after this many starts in a row
+    # that fail or die within STREAM_MIN_UPTIME seconds
+    STREAM_MAX_FAILURES = 3
+    STREAM_MIN_UPTIME = 30
+
+    # Seconds to wait for signal-cli to answer a streamed send
+    STREAM_SEND_TIMEOUT = 30
+
     def __init__(self, signal_cli_path: str = "signal-cli"):
         self.phone_number: Optional[str] = None
-        self.allowed_group_ids: set[str] = set()
+        self.allowed_group_ids: frozenset[str] = frozenset()
         self.signal_cli_path = signal_cli_path
 
-    def configure(self, phone_number: str, allowed_group_ids: list[str]):
+        # Streaming mode: one long-lived `signal-cli jsonRpc` instead of a
+        # process (and JVM startup) per receive/send
+        self.streaming = False
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._stream_task: Optional[asyncio.Task] = None
+        self._incoming: asyncio.Queue = asyncio.Queue()
+        self._rpc_id = 0
+        self._pending: dict[int, asyncio.Future] = {}  # JSON-RPC id -> response
+
+        # Outbound batching state (see send_message)
+        self._send_queue: dict[str, list[str]] = defaultdict(list)
+        self._flush_future: Optional[asyncio.Future] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def configure(self, phone_number: str, allowed_group_ids: list[str], streaming: bool = False):
         self.phone_number = phone_number
-        self.allowed_group_ids = set(allowed_group_ids)
+        self.allowed_group_ids = frozenset(allowed_group_ids)
+        self.streaming = streaming
+
+    async def start(self):
+        """Start the long-lived signal-cli process (streaming mode only)."""
+        if self.streaming and not self._stream_task:
+            self._stream_task = asyncio.ensure_future(self._stream_loop())
+
+    async def close(self):
+        """Stop the long-lived signal-cli process, if any."""
+        if self._stream_task:
+            self._stream_task.cancel()
+            await asyncio.gather(self._stream_task, return_exceptions=True)
+            self._stream_task = None
+
+        proc, self._proc = self._proc, None
+        await self._stop_proc(proc)
+
+    @staticmethod
+    async def _stop_proc(proc: Optional[asyncio.subprocess.Process]):
+        """Close a signal-cli process's stdin, then kill it if it hasn't exited within 3s."""
+        if proc and proc.returncode is None:
+            try:
+                proc.stdin.close()
+                await asyncio.wait_for(proc.wait(), timeout=3)
+            except (asyncio.TimeoutError, ProcessLookupError, OSError):
+                try:
+                    proc.kill()
+                    await proc.wait()
+                except ProcessLookupError:
+                    pass  # Already dead
+
+    def _stream_alive(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    async def _stream_loop(self):
+        """
+        Run `signal-cli jsonRpc`, queue incoming messages, restart it if it exits.
+
+        If it can't stay up, switch back to polling rather than go deaf.
+        """
+        cmd = [self.signal_cli_path, "-u", self.phone_number, "jsonRpc"]
+        failures = 0
+        while True:
+            started = time.monotonic()
+            try:
+                self._proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=2 ** 20  # Envelopes with long messages/quotes exceed the 64KB default
+                )
+                logger.info(f"[STREAM] signal-cli jsonRpc started (pid {self._proc.pid})")
+
+                stderr_task = asyncio.ensure_future(self._drain_stream_stderr(self._proc))
+                try:
+                    while True:
+                        try:
+                            line = await self._proc.stdout.readline()
+                        except ValueError as e:
+                            # Line over the limit - readline has dropped it, keep reading
+                            logger.warning(f"[STREAM] Skipping oversized line: {e}")
+                            continue
+                        if not line:
+                            break
+                        try:
+                            self._handle_stream_line(line)
+                        except Exception as e:
+                            # One bad line mustn't take down the stream
+                            logger.error(f"[STREAM] Failed to handle line: {e} - line: {line[:100]}")
+                finally:
+                    stderr_task.cancel()
+                    self._fail_pending(ConnectionError("signal-cli jsonRpc exited"))
+
+                returncode = await self._proc.wait()
+                logger.warning(f"[STREAM] signal-cli exited ({returncode})")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[STREAM] signal-cli failed: {e}")
+            finally:
+                # Don't leave a live process behind - it holds the account lock,
+                # so the restart (or polling) would fail against it
+                await self._stop_proc(self._proc)
+
+            if time.monotonic() - started < self.STREAM_MIN_UPTIME:
+                failures += 1
+            else:
+                failures = 0
+            if failures >= self.STREAM_MAX_FAILURES:
+                logger.error(f"[STREAM] signal-cli jsonRpc failed {failures} times in a row - falling back to polling")
+                self._proc = None
+                self.streaming = False
+                return
+
+            logger.info(f"[STREAM] Restarting signal-cli in {self.STREAM_RESTART_DELAY}s")
+            await asyncio.sleep(self.STREAM_RESTART_DELAY)
+
+    async def _drain_stream_stderr(self, proc: asyncio.subprocess.Process):
+        """Log signal-cli's stderr - an unread pipe would eventually block it."""
+        async for line in proc.stderr:
+            text = line.decode('utf-8', errors='replace').strip()
+            if text:
+                logger.warning(f"[STREAM] signal-cli stderr: {text[:200]}")
+
+    def _fail_pending(self, exc: Exception):
+        """Fail requests still waiting on a response - it isn't coming."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    def _handle_stream_line(self, line: bytes):
+        """Dispatch one JSON-RPC line from signal-cli."""
+        line = line.strip()
+        if not line:
+            return
+        # Receipt/typing notifications can't carry a message - don't parse them.
+        # Anything without an envelope (RPC responses) always goes through.
+        if b'"envelope"' in line and b'"dataMessage"' not in line and not logger.isEnabledFor(logging.DEBUG):
+            return
+        try:
+            # orjson parses the raw bytes - no decoded copy of the line
+            msg = parse_json(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"[STREAM] JSON decode error: {e} - line: {line[:100]}")
+            return
+        if not isinstance(msg, dict):
+            logger.warning(f"[STREAM] Ignoring non-object line: {line[:100]}")
+            return
+
+        if msg.get('method') == 'receive':
+            # params is {"envelope": ..., "account": ...} - same shape as `receive --output json`
+            self._incoming.put_nowait(self._parse_incoming(msg.get('params', {})))
+            return
+
+        future = self._pending.pop(msg.get('id'), None)
+        if future is not None and not future.done():
+            future.set_result(msg)
+        elif 'error' in msg:
+            logger.error(f"[STREAM] signal-cli error (id {msg.get('id')}): {msg['error']}")
+
+    def _parse_incoming(self, msg: dict) -> ParsedMessage:
+        """Flatten a received envelope and log it - text at INFO, receipts/typing at DEBUG."""
+        env = msg.get('envelope', msg)
+        data_msg = env.get('dataMessage')
+        if not data_msg:
+            # Receipts/typing are most of the traffic - don't classify them unless someone's looking
+            if logger.isEnabledFor(logging.DEBUG):
+                msg_type = 'receipt' if env.get('receiptMessage') else 'typing' if env.get('typingMessage') else 'other'
+                logger.debug("[RAW %s] from=%s", msg_type.upper(), env.get('source') or 'unknown')
+            return ParsedMessage(env.get('timestamp'), None, env.get('source'), None, [])
+
+        group_info = data_msg.get('groupInfo') or {}
+        parsed = ParsedMessage(
+            timestamp=env.get('timestamp'),
+            group_id=group_info.get('groupId'),
+            sender=env.get('source'),
+            text=data_msg.get('message'),
+            mentions=data_msg.get('mentions') or [],
+        )
+
+        if parsed.text and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[RAW MSG] from=%s group=%s... text=%s",
+                parsed.sender or 'unknown', parsed.group_id[:20] if parsed.group_id else 'DM', parsed.text[:100]
+            )
+        elif not parsed.text:
+            logger.debug("[RAW DATA] from=%s (no text)", parsed.sender or 'unknown')
+        return parsed
+
+    async def _receive_streamed(self) -> list[ParsedMessage]:
+        """Wait up to RECEIVE_WAIT for a streamed message, then take everything queued."""
+        try:
+            messages = [await asyncio.wait_for(self._incoming.get(), timeout=self.RECEIVE_WAIT)]
+        except asyncio.TimeoutError:
+            return []
+        while not self._incoming.empty():
+            messages.append(self._incoming.get_nowait())
+        logger.debug(f"[STREAM] Took {len(messages)} messages")
+        return messages
 
-    async def receive_messages(self) -> list[dict]:
+    async def receive_messages(self) -> list[ParsedMessage]:
         """Poll for new messages using signal-cli (async)."""
+        if self.streaming:
+            return await self._receive_streamed()
+
         try:
             cmd = [self.signal_cli_path, "-u", self.phone_number, "--output", "json", "receive"]
             logger.debug("[POLL] Starting receive...")
@@ -295,28 +740,19 @@ class SignalCLINative:
                 logger.warning(f"[POLL] signal-cli returned {returncode}")
 
             messages = []
-            raw_output = stdout.strip()
 
-            if raw_output:
-                logger.debug(f"[POLL] Received {len(raw_output)} bytes")
+            if stdout:
+                logger.debug(f"[POLL] Received {len(stdout)} bytes")
 
-            for line in raw_output.split('\n'):
-                if line:
+            # Receipt/typing envelopes (most lines) can't carry a message - skip
+            # them unparsed, unless DEBUG wants them logged
+            skip_non_data = not logger.isEnabledFor(logging.DEBUG)
+            for line in stdout.splitlines():
+                if skip_non_data and '"dataMessage"' not in line:
+                    continue
+                if line.strip():
                     try:
-                        msg = json.loads(line)
-                        messages.append(msg)
-                        env = msg.get('envelope', msg)
-                        data_msg = env.get('dataMessage', {})
-                        text = data_msg.get('message', '')
-                        group_info = data_msg.get('groupInfo', {})
-                        group = group_info.get('groupId', 'DM')
-                        sender = env.get('source', 'unknown')
-
-                        if text:
-                            logger.info(f"[RAW MSG] from={sender} group={group[:20] if group != 'DM' else 'DM'}... text={text[:100]}")
-                        else:
-                            msg_type = 'receipt' if env.get('receiptMessage') else 'typing' if env.get('typingMessage') else 'other'
-                            logger.debug(f"[RAW {msg_type.upper()}] from={sender}")
+                        messages.append(self._parse_incoming(parse_json(line)))
                     except json.JSONDecodeError as e:
                         logger.warning(f"[POLL] JSON decode error: {e} - line: {line[:100]}")
                         continue
@@ -331,17 +767,76 @@ class SignalCLINative:
             return []
 
     async def send_message(self, group_id: str, message: str):
+        """
+        Queue a message for a group and wait until it has been sent.
+
+        Messages queued within SEND_BATCH_WINDOW are coalesced, so a burst
+        of sends to the same group pays signal-cli (JVM) startup once.
+        """
+        loop = asyncio.get_running_loop()
+        self._send_queue[group_id].append(message)
+
+        if self._flush_future is None:
+            self._flush_future = loop.create_future()
+            loop.call_later(self.SEND_BATCH_WINDOW, self._schedule_flush)
+
+        # Shield so one cancelled caller doesn't cancel the batch for everyone
+        await asyncio.shield(self._flush_future)
+
+    def _schedule_flush(self):
+        # Keep a reference so the flush task isn't garbage collected mid-send
+        self._flush_task = asyncio.ensure_future(self._flush())
+
+    async def _flush(self):
+        """Send everything queued since the last flush, one signal-cli call per batch."""
+        pending, self._send_queue = self._send_queue, defaultdict(list)
+        future, self._flush_future = self._flush_future, None
+
+        try:
+            # Groups are independent - send them concurrently
+            await asyncio.gather(
+                *(self._send_batches(group_id, messages) for group_id, messages in pending.items()),
+                return_exceptions=True
+            )
+        finally:
+            if future and not future.done():
+                future.set_result(None)
+
+    async def _send_batches(self, group_id: str, messages: list[str]):
+        """Send a group's queued messages in order, coalesced into as few sends as possible."""
+        for batch in self._coalesce(messages):
+            await self._send_now(group_id, batch)
+
+    def _coalesce(self, messages: list[str]) -> list[str]:
+        """Join queued messages with blank lines, starting a new batch before the length limit."""
+        batches = []
+        current = ""
+        for message in messages:
+            if current and len(current) + len(message) + 2 > self.MAX_MESSAGE_LENGTH:
+                batches.append(current)
+                current = message
+            else:
+                current = f"{current}\n\n{message}" if current else message
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _send_now(self, group_id: str, message: str):
         """Send a message to a group via stdin (async)."""
         try:
             message = strip_markdown(message)
 
-            balance = check_openrouter_balance()
+            balance = await get_openrouter_balance()
             if balance is not None and balance < 10:
                 message += f"\n\n⚠️ LOW BALANCE: ${balance:.2f} remaining"
 
-            if len(message) > 4000:
+            if len(message) > self.MAX_MESSAGE_LENGTH:
                 message = message[:3900] + "\n\n[truncated]"
 
+            if self._stream_alive():
+                await self._send_streamed(group_id, message)
+                return
+
             cmd = [self.signal_cli_path, "-u", self.phone_number, "send", "-g", group_id, "--message-from-stdin"]
             returncode, stdout, stderr = await run_subprocess_async(
                 cmd, timeout=30, input_data=message.encode('utf-8')
@@ -354,18 +849,33 @@ class SignalCLINative:
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
 
-    def extract_group_message(self, envelope: dict) -> Optional[tuple[str, str, str, list]]:
-        """Extract group ID, sender, message text, and mentions."""
-        env = envelope.get('envelope', envelope)
-        data_message = env.get('dataMessage', {})
-        group_info = data_message.get('groupInfo', {})
-        group_id = group_info.get('groupId')
-        message = data_message.get('message')
-        sender = env.get('source')
-        mentions = data_message.get('mentions', [])
-
-        if group_id and message and group_id in self.allowed_group_ids:
-            return (group_id, sender, message, mentions)
+    async def _send_streamed(self, group_id: str, message: str):
+        """Send through the running jsonRpc process and wait for its response."""
+        self._rpc_id += 1
+        rpc_id = self._rpc_id
+        request = {
+            "jsonrpc": "2.0",
+            "method": "send",
+            "params": {"groupId": group_id, "message": message},
+            "id": rpc_id,
+        }
+        future = self._pending[rpc_id] = asyncio.get_running_loop().create_future()
+        try:
+            self._proc.stdin.write(dump_json_bytes(request) + b"\n")
+            await self._proc.stdin.drain()
+            response = await asyncio.wait_for(future, timeout=self.STREAM_SEND_TIMEOUT)
+        finally:
+            self._pending.pop(rpc_id, None)
+
+        if 'error' in response:
+            logger.error(f"[-> SIGNAL FAILED] {response['error']}")
+        else:
+            logger.info(f"[-> SIGNAL]\n{message}")
+
+    def extract_group_message(self, msg: ParsedMessage) -> Optional[tuple[str, str, str, list]]:
+        """Extract group ID, sender, message text, and mentions - None unless from an allowed group."""
+        if msg.group_id and msg.text and msg.group_id in self.allowed_group_ids:
+            return (msg.group_id, msg.sender, msg.text, msg.mentions)
         return None
 
 
@@ -376,6 +886,152 @@ class SignalCLINative:
 # Global claude path (set by Orchestrator on init)
 _claude_path = "claude"
 
+# Persistent Claude processes, one per (model, tools, working dir, max turns) - opt-in via
+# claude_workers in settings.yaml (set by Orchestrator on init)
+_claude_workers_enabled = False
+_claude_workers: dict[tuple, 'ClaudeWorker'] = {}
+
+
+def _count_tool_uses(item: dict, tool_counts: dict[str, int]):
+    """Tally tool_use blocks from one assistant message of Claude's JSON output."""
+    if item.get('type') != 'assistant':
+        return
+    for block in item.get('message', {}).get('content', []):
+        if isinstance(block, dict) and block.get('type') == 'tool_use':
+            tool_name = block.get('name', 'unknown')
+            tool_counts[tool_name] = tool_counts.get(tool_name, 0) + 1
+
+
+class ClaudeWorkerUnavailable(Exception):
+    """The worker failed before the prompt reached it - safe to retry one-shot."""
+
+
+class ClaudeWorker:
+    """
+    A long-lived `claude -p` process fed prompts over stdin (stream-json).
+
+    Skips the CLI startup and session resume on every call. The process is
+    bound to one model, tool set and session, so a call resuming a different
+    session restarts it. One prompt at a time - replies aren't tagged with an id.
+    """
+
+    def __init__(self, model: str, allowed_tools: str, working_dir: Path, max_turns: int):
+        self.model = model
+        self.allowed_tools = allowed_tools
+        self.working_dir = working_dir
+        self.max_turns = max_turns
+        self.session_id: Optional[str] = None
+        self.lock = asyncio.Lock()
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    async def _start(self, session_id: Optional[str]):
+        cmd = [
+            _claude_path,
+            "-p",
+            "--input-format", "stream-json",
+            "--output-format", "stream-json",
+            "--verbose",
+            "--model", self.model,
+            "--max-turns", str(self.max_turns),
+        ]
+        if self.allowed_tools:
+            cmd.extend(["--tools", self.allowed_tools])
+        if session_id:
+            cmd.extend(["--resume", session_id])
+
+        self._proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.working_dir),
+            limit=2**22
+        )
+        self._stderr_task = asyncio.create_task(self._drain_stderr(self._proc))
+        self.session_id = session_id
+        logger.info(f"[CLAUDE] Started persistent {self.model} worker (pid {self._proc.pid})")
+
+    async def _drain_stderr(self, proc: asyncio.subprocess.Process):
+        async for line in proc.stderr:
+            text = line.decode('utf-8', errors='replace').strip()
+            if text:
+                logger.warning(f"[CLAUDE WORKER] {self.model} stderr: {text[:200]}")
+
+    async def ask(self, prompt: str, session_id: Optional[str], timeout: float) -> tuple[str, Optional[str], dict[str, int]]:
+        """
+        Send one prompt and wait for its result message.
+
+        Raises ClaudeWorkerUnavailable if the process couldn't be started or fed
+        the prompt (nothing ran, so the caller may retry one-shot). Any failure
+        after that raises as-is - the prompt may already be acting, so it must
+        not be retried. The process is killed either way so the next call starts clean.
+        """
+        async with self.lock:
+            if not self.alive() or session_id != self.session_id:
+                await self.close()
+                try:
+                    await self._start(session_id)
+                except Exception as e:
+                    raise ClaudeWorkerUnavailable(f"start failed: {e}") from e
+
+            try:
+                return await asyncio.wait_for(self._exchange(prompt), timeout=timeout)
+            except BaseException:
+                await self.close()
+                raise
+
+    async def _exchange(self, prompt: str) -> tuple[str, Optional[str], dict[str, int]]:
+        request = {"type": "user", "message": {"role": "user", "content": prompt}}
+        try:
+            self._proc.stdin.write(dump_json_bytes(request) + b"\n")
+            await self._proc.stdin.drain()
+        except (ConnectionError, OSError) as e:
+            raise ClaudeWorkerUnavailable(f"prompt not delivered: {e}") from e
+
+        tool_counts: dict[str, int] = {}
+        async for line in self._proc.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            item = parse_json(line)
+            if not isinstance(item, dict):
+                continue
+            if 'session_id' in item:
+                self.session_id = item['session_id']
+            _count_tool_uses(item, tool_counts)
+            if item.get('type') == 'result':
+                return item.get('result', ''), self.session_id, tool_counts
+
+        raise ConnectionError(f"claude exited (rc={self._proc.returncode})")
+
+    async def close(self):
+        """Stop the process, if running."""
+        proc, self._proc = self._proc, None
+        if proc and proc.returncode is None:
+            try:
+                proc.stdin.close()
+                await asyncio.wait_for(proc.wait(), timeout=3)
+            except (asyncio.TimeoutError, ProcessLookupError, OSError):
+                try:
+                    proc.kill()
+                    await proc.wait()
+                except ProcessLookupError:
+                    pass  # Already dead
+        if self._stderr_task:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+
+
+async def close_claude_workers():
+    """Stop all persistent Claude processes (on shutdown)."""
+    workers = list(_claude_workers.values())
+    _claude_workers.clear()
+    await asyncio.gather(*(worker.close() for worker in workers), return_exceptions=True)
+
 
 async def call_claude_code(
     prompt: str,
@@ -408,6 +1064,25 @@ async def call_claude_code(
     else:
         logger.info(f"[CLAUDE] Calling {model}...")
 
+    if _claude_workers_enabled:
+        key = (model, allowed_tools, str(working_dir), max_turns)
+        worker = _claude_workers.get(key)
+        if worker is None:
+            worker = _claude_workers[key] = ClaudeWorker(model, allowed_tools, working_dir, max_turns)
+        try:
+            response_text, new_session_id, tool_counts = await worker.ask(prompt, session_id, timeout)
+            logger.info(f"[CLAUDE] {model} finished (worker)")
+            return _claude_result(model, response_text, session_id, new_session_id, tool_counts)
+        except asyncio.TimeoutError:
+            logger.error(f"[TIMEOUT] Claude exceeded {timeout}s (worker killed)")
+            return f"Request timed out after {timeout}s", session_id, ""
+        except ClaudeWorkerUnavailable as e:
+            logger.warning(f"[CLAUDE] {model} worker unavailable ({e}), falling back to one-shot call")
+        except Exception as e:
+            # The prompt was delivered - re-running it could repeat edits/commands
+            logger.error(f"[CLAUDE] {model} worker failed mid-request: {e}")
+            return f"Error: {e}", session_id, ""
+
     cmd = [
         _claude_path,
         "-p", prompt,
@@ -443,47 +1118,29 @@ async def call_claude_code(
         tool_counts: dict[str, int] = {}
 
         try:
-            data_list = json.loads(output)
-
-            if isinstance(data_list, list):
-                for item in data_list:
-                    if isinstance(item, dict):
-                        if 'session_id' in item:
-                            new_session_id = item['session_id']
-                        if item.get('type') == 'result' and 'result' in item:
-                            response_text = item['result']
-                        # Extract tool usage from assistant messages
-                        if item.get('type') == 'assistant':
-                            message = item.get('message', {})
-                            content = message.get('content', [])
-                            for block in content:
-                                if isinstance(block, dict) and block.get('type') == 'tool_use':
-                                    tool_name = block.get('name', 'unknown')
-                                    tool_counts[tool_name] = tool_counts.get(tool_name, 0) + 1
+            if output[0] == '{':
+                # Fast path: single result object, nothing to iterate
+                data = parse_json(output)
+                new_session_id = data.get('session_id', session_id)
+                response_text = data.get('result', '')
             else:
-                if 'session_id' in data_list:
-                    new_session_id = data_list['session_id']
-                if 'result' in data_list:
-                    response_text = data_list['result']
-
-            # Log tool usage
-            if tool_counts:
-                tools_str = ", ".join(f"{k}: {v}" for k, v in sorted(tool_counts.items()))
-                logger.info(f"[CLAUDE TOOLS] {model}: {tools_str}")
+                data_list = parse_json(output)
+
+                if isinstance(data_list, list):
+                    for item in data_list:
+                        if isinstance(item, dict):
+                            if 'session_id' in item:
+                                new_session_id = item['session_id']
+                            if item.get('type') == 'result' and 'result' in item:
+                                response_text = item['result']
+                            # Extract tool usage from assistant messages
+                            _count_tool_uses(item, tool_counts)
 
         except json.JSONDecodeError:
             logger.warning("[CLAUDE] Output not JSON, using as plain text")
             response_text = output
 
-        if new_session_id and new_session_id != session_id:
-            logger.info(f"[SESSION] {new_session_id[:20]}...")
-
-        # Format tool summary for caller
-        tool_summary = ""
-        if tool_counts:
-            tool_summary = ", ".join(f"{k}: {v}" for k, v in sorted(tool_counts.items()))
-
-        return response_text or "No response from Claude", new_session_id, tool_summary
+        return _claude_result(model, response_text, session_id, new_session_id, tool_counts)
 
     except subprocess.TimeoutExpired:
         logger.error(f"[TIMEOUT] Claude exceeded {timeout}s (killed)")
@@ -494,14 +1151,32 @@ async def call_claude_code(
         return f"Error: {e}", session_id, ""
 
 
+def _claude_result(
+    model: str,
+    response_text: str,
+    session_id: Optional[str],
+    new_session_id: Optional[str],
+    tool_counts: dict[str, int]
+) -> tuple[str, Optional[str], str]:
+    """Log the session change and tool usage, and shape call_claude_code's return value."""
+    if new_session_id and new_session_id != session_id:
+        logger.info(f"[SESSION] {new_session_id[:20]}...")
+
+    # Format tool summary for caller (and log it)
+    tool_summary = ""
+    if tool_counts:
+        tool_summary = ", ".join(f"{k}: {v}" for k, v in sorted(tool_counts.items()))
+        logger.info(f"[CLAUDE TOOLS] {model}: {tool_summary}")
+
+    return response_text or "No response from Claude", new_session_id, tool_summary
+
+
 async def handle_message_tiered(
     message: str,
-    status_lines: list[str],
-    conversation: list[dict],
-    ops_log: str,
     project_path: Path,
     sonnet_session_id: Optional[str] = None,
-    opus_session_id: Optional[str] = None
+    opus_session_id: Optional[str] = None,
+    escalate: Optional[Callable[..., Awaitable[tuple]]] = None
 ) -> tuple[str, str, Optional[str], Optional[str]]:
     """
     Handle a message using tiered model approach (async).
@@ -509,6 +1184,10 @@ async def handle_message_tiered(
     1. Try Sonnet with read-only tools
     2. If Sonnet needs action, escalate to Opus
 
+    escalate, if given, makes the Opus call instead of call_claude_code
+    (same keyword args minus session_id) - the orchestrator uses it to run
+    the escalation under its Opus session lock.
+
     Returns:
         (response, model_used, sonnet_session_id, opus_session_id, tool_summary)
     """
@@ -524,20 +1203,24 @@ async def handle_message_tiered(
         max_turns=5
     )
 
-    # Check for escalation
-    logger.info(f"[SONNET] {response[:200]}...")
-    if response.strip().upper().startswith('ESCALATE:'):
-        reason = response.split(':', 1)[1].strip() if ':' in response else 'Action required'
+    # Check for escalation - only the head matters, don't scan/copy a long response
+    head = response[:256]
+    logger.info("[SONNET] %s...", head[:200])
+    if head.lstrip()[:9].upper() == 'ESCALATE:':
+        reason = head.split(':', 1)[1].strip() or 'Action required'
         logger.info(f"[$$$ OPUS $$$] Escalating: {reason}")
 
-        response, opus_session_id, tool_summary = await call_claude_code(
+        opus_kwargs = dict(
             prompt=message,
             working_dir=project_path,
             model='opus',
             allowed_tools='Read,Edit,Write,Bash,Glob,Grep',
-            timeout=120,
-            session_id=opus_session_id
+            timeout=120
         )
+        if escalate:
+            response, opus_session_id, tool_summary = await escalate(**opus_kwargs)
+        else:
+            response, opus_session_id, tool_summary = await call_claude_code(**opus_kwargs, session_id=opus_session_id)
         return response, 'opus', sonnet_session_id, opus_session_id, tool_summary
 
     return response, 'sonnet', sonnet_session_id, opus_session_id, tool_summary
@@ -555,11 +1238,14 @@ def load_config() -> dict:
         Path.home() / '.config/sunfish/settings.yaml'
     ]
 
+    if not HAS_LIBYAML:
+        logger.warning("PyYAML built without libyaml - using slow pure-Python config loader")
+
     for path in config_paths:
         if path.exists():
             logger.info(f"Loading config: {path}")
             with open(path) as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YamlLoader)
 
     logger.error("No config found. Create config/settings.yaml")
     sys.exit(1)
@@ -579,11 +1265,50 @@ def get_project_path(config: dict) -> Path:
 # Main Orchestrator
 # =============================================================================
 
+# "opus" / "@opus" as a word - not inside "opuscule"
+_OPUS_PATTERN = re.compile(r'(?<!\w)@?opus(?!\w)', re.IGNORECASE)
+
+
 class Orchestrator:
     """Main orchestrator that ties everything together."""
 
+    # Processed message timestamps kept in memory for dedup
+    MAX_PROCESSED_TIMESTAMPS = 1000
+
+    # Seconds to coalesce session-state changes before writing .sessions.json
+    SESSION_FLUSH_DELAY = 1.0
+
+    # Persist new dedup timestamps after this many, or once this many seconds
+    # have passed since the last write. Bounds crash replay to a few messages.
+    TIMESTAMP_SAVE_BATCH = 10
+    TIMESTAMP_SAVE_INTERVAL = 5.0
+
+    # Worker threads for blocking I/O (monitor probes, file writes, HTTP)
+    IO_THREADS = 4
+
+    # Seconds loops get to finish their current iteration after a shutdown request
+    # (below main()'s 5s force-exit timer)
+    SHUTDOWN_GRACE = 3.0
+
+    # Temp cleanup sweep interval when folder creation is being watched
+    CLEANUP_WATCH_FALLBACK_INTERVAL = 86400
+
+    # Max seconds between the Signal timestamps of two identical messages (same
+    # sender, group and text) for the second to count as a double delivery.
+    # Kept short so a user deliberately re-sending a question still gets an answer.
+    INBOUND_DEDUP_WINDOW = 5
+
+    # Seconds an identical Sonnet observation isn't re-broadcast for (alerts always are)
+    OBSERVATION_DEDUP_WINDOW = 600
+
+    # Seconds an identical non-alert broadcast is suppressed for
+    BROADCAST_DEDUP_WINDOW = 60
+
+    # Seconds a monitor's status line is reused before probing it again
+    STATUS_LINE_TTL = 30
+
     def __init__(self, config: dict):
-        global _claude_path
+        global _claude_path, _claude_workers_enabled
 
         self.config = config
         self.project_path = get_project_path(config)
@@ -592,12 +1317,14 @@ class Orchestrator:
         paths = config.get('paths', {})
         signal_cli_path = paths.get('signal_cli', 'signal-cli')
         _claude_path = paths.get('claude', 'claude')
+        _claude_workers_enabled = config.get('claude_workers', False)
 
         # Initialize components
         self.signal = SignalCLINative(signal_cli_path=signal_cli_path)
         self.signal.configure(
             phone_number=config['signal']['phone_number'],
-            allowed_group_ids=config['signal']['allowed_group_ids']
+            allowed_group_ids=config['signal']['allowed_group_ids'],
+            streaming=config['signal'].get('receive_mode', 'poll') == 'stream'
         )
 
         self.health = HealthAggregator(config)
@@ -606,6 +1333,10 @@ class Orchestrator:
 
         # Settings
         self.trigger_word = config.get('trigger_word', '').lower()
+        # Whole-word, case-insensitive: matches "@Claude," but not "@claudette"
+        self._trigger_pattern = re.compile(
+            r'(?<!\w)' + re.escape(self.trigger_word) + r'(?!\w)', re.IGNORECASE
+        ) if self.trigger_word else None
         self.poll_interval = config.get('poll_interval', 2)
         self.proactive_alerts = config.get('proactive_alerts', True)
         self.use_tiered_models = config.get('use_tiered_models', True)
@@ -615,41 +1346,171 @@ class Orchestrator:
         _openrouter_api_key = config.get('openrouter', {}).get('api_key')
 
         # State
-        self.message_buffer: list[dict] = []
         self.buffer_size = config.get('context_buffer_size', 30)
+        self.message_buffer: deque[dict] = deque(maxlen=self.buffer_size)
 
         # Persistent state file (sessions + processed timestamps)
         self.session_file = self.project_path / ".sessions.json"
-        self.sonnet_session_id, self.opus_session_id, self.processed_timestamps = self._load_sessions()
+        # Present while running; left behind by a crash (see _detect_crash_recovery)
+        self.marker_file = self.project_path / ".running"
+        self.sonnet_session_id, self.opus_session_id, loaded_timestamps = self._load_sessions()
+
+        # Dedup cache: deque keeps insertion order for O(1) eviction, set gives O(1) lookups
+        self._ts_order: deque = deque(loaded_timestamps, maxlen=self.MAX_PROCESSED_TIMESTAMPS)
+        self.processed_timestamps: set = set(self._ts_order)
+        self._unsaved_ts = 0
+        self._last_save = time.monotonic()
+        self._saved_state = self._session_state()  # What's on disk, to skip no-op writes
         logger.info(f"[SESSION] Loaded - Sonnet: {self.sonnet_session_id[:20] if self.sonnet_session_id else 'None'}..., Opus: {self.opus_session_id[:20] if self.opus_session_id else 'None'}...")
         logger.info(f"[DEDUP] Loaded {len(self.processed_timestamps)} processed message timestamps")
 
-    def _load_sessions(self) -> tuple[Optional[str], Optional[str], set]:
+        # Content hash -> monotonic expiry, for duplicates timestamps can't catch
+        self._content_seen: dict[bytes, float] = {}
+        # Inbound content hash -> Signal timestamp (ms) it was first seen with
+        self._inbound_seen: dict[bytes, int] = {}
+
+        # Monitor name -> (monotonic time probed, status line); see _cached_status_line
+        self._status_line_cache: dict[str, tuple[float, str]] = {}
+
+        # Set by request_shutdown (SIGINT/SIGTERM); loops exit at their next sleep
+        self._shutdown_event = asyncio.Event()
+        self._shutdown_wait_task: Optional[asyncio.Future] = None
+
+        # Dedicated pool for blocking work - installed as the loop's default
+        # executor in run(), so asyncio.to_thread uses it too
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.IO_THREADS, thread_name_prefix='relay-io'
+        )
+
+        # Message handlers run as tasks; bound how many Claude calls are in flight
+        self._inflight = asyncio.Semaphore(config.get('max_concurrent_claude', 2))
+        self._handler_tasks: set[asyncio.Task] = set()
+        self._session_locks = {'sonnet': asyncio.Lock(), 'opus': asyncio.Lock()}
+
+        # Set by _save_sessions, drained by _session_flush_loop (writes happen off-loop)
+        self._sessions_dirty = asyncio.Event()
+        self._session_file_lock = threading.Lock()
+
+    def _load_sessions(self) -> tuple[Optional[str], Optional[str], list]:
         """Load session IDs and processed timestamps from disk."""
         try:
             if self.session_file.exists():
                 with open(self.session_file) as f:
                     data = json.load(f)
-                    timestamps = set(data.get('processed_timestamps', []))
+                    timestamps = data.get('processed_timestamps', [])
                     return data.get('sonnet'), data.get('opus'), timestamps
         except Exception as e:
             logger.warning(f"Could not load sessions: {e}")
-        return None, None, set()
+        return None, None, []
 
     def _save_sessions(self):
-        """Persist session IDs and processed timestamps to disk."""
-        try:
-            # Keep only last 500 timestamps to prevent file bloat
-            timestamps_list = list(self.processed_timestamps)[-500:]
-            with open(self.session_file, 'w') as f:
-                json.dump({
-                    'sonnet': self.sonnet_session_id,
-                    'opus': self.opus_session_id,
-                    'processed_timestamps': timestamps_list,
-                    'updated': datetime.now().isoformat()
-                }, f)
-        except Exception as e:
-            logger.warning(f"Could not save sessions: {e}")
+        """
+        Mark session state dirty. The flush loop writes it within SESSION_FLUSH_DELAY,
+        so a burst of messages/Claude calls becomes a single disk write.
+        """
+        self._sessions_dirty.set()
+
+    def _save_sessions_now(self):
+        """Persist session IDs and processed timestamps to disk (blocking)."""
+        self._write_sessions(self._session_snapshot())
+
+    def _session_state(self) -> tuple:
+        """Cheap fingerprint of what _session_snapshot would write (minus the time)."""
+        return (
+            self.sonnet_session_id,
+            self.opus_session_id,
+            len(self._ts_order),
+            self._ts_order[-1] if self._ts_order else None,
+        )
+
+    def _session_snapshot(self) -> dict:
+        """
+        Capture session state for writing.
+
+        Must run on the event loop thread - the timestamp deque is mutated
+        there and can't be iterated safely from the executor.
+        """
+        self._unsaved_ts = 0
+        self._last_save = time.monotonic()
+        return {
+            'sonnet': self.sonnet_session_id,
+            'opus': self.opus_session_id,
+            # The whole dedup window (bounded by MAX_PROCESSED_TIMESTAMPS), so a
+            # restart after a crash still recognizes everything seen in memory
+            'processed_timestamps': list(self._ts_order),
+            'updated': datetime.now().isoformat()
+        }
+
+    def _write_sessions(self, data: dict):
+        """Write a session snapshot to disk. Safe to call from a worker thread."""
+        with self._session_file_lock:
+            try:
+                # Atomic + durable: fsync the temp file before the rename so a
+                # power loss can't leave a truncated .sessions.json behind
+                temp_path = self.session_file.with_suffix('.tmp')
+                payload = memoryview(dump_json_bytes(data))
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    while payload:
+                        payload = payload[os.write(fd, payload):]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(temp_path, self.session_file)
+
+                # POSIX: fsync the directory so the rename itself is durable
+                if os.name == 'posix':
+                    dir_fd = os.open(self.session_file.parent, os.O_RDONLY)
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
+            except Exception as e:
+                logger.warning(f"Could not save sessions: {e}")
+
+    def _remember_timestamp(self, timestamp):
+        """Record a processed timestamp, evicting the oldest once the cache is full."""
+        if len(self._ts_order) == self._ts_order.maxlen:
+            self.processed_timestamps.discard(self._ts_order[0])
+        self._ts_order.append(timestamp)
+        self.processed_timestamps.add(timestamp)
+        self._unsaved_ts += 1
+
+    def _seen_recently(self, *parts: str, window: float) -> bool:
+        """
+        True if the same content was seen within `window` seconds; otherwise record it.
+
+        Expired entries are swept lazily once the table grows.
+        """
+        now = time.monotonic()
+        key = hashlib.blake2b("\x1f".join(parts).encode('utf-8'), digest_size=8).digest()
+        expiry = self._content_seen.get(key)
+        if expiry is not None and expiry > now:
+            return True
+        if len(self._content_seen) >= 256:
+            self._content_seen = {k: t for k, t in self._content_seen.items() if t > now}
+        self._content_seen[key] = now + window
+        return False
+
+    def _is_double_delivery(self, timestamp: Optional[int], group_id: str, sender: str, text: str) -> bool:
+        """
+        True if identical content from the same sender was seen under a different
+        Signal timestamp at most INBOUND_DEDUP_WINDOW seconds apart; otherwise record it.
+
+        Compares message timestamps rather than arrival time, so a slow reply
+        doesn't swallow a deliberate re-send.
+        """
+        if timestamp is None:
+            return False
+        window_ms = self.INBOUND_DEDUP_WINDOW * 1000
+        key = hashlib.blake2b("\x1f".join((group_id, sender, text)).encode('utf-8'), digest_size=8).digest()
+        first = self._inbound_seen.get(key)
+        if first is not None and first != timestamp and abs(timestamp - first) <= window_ms:
+            return True
+        if len(self._inbound_seen) >= 256:
+            self._inbound_seen = {k: t for k, t in self._inbound_seen.items() if abs(timestamp - t) <= window_ms}
+        self._inbound_seen[key] = timestamp
+        return False
 
     async def run(self):
         """Main entry point - runs signal and monitoring as independent tasks."""
@@ -659,8 +1520,13 @@ class Orchestrator:
         logger.info(f"Monitors loaded: {list(self.health.monitors.keys())}")
         logger.info(f"Tiered models: {'enabled' if self.use_tiered_models else 'disabled'}")
 
+        asyncio.get_running_loop().set_default_executor(self._io_executor)
+
+        # Long-lived signal-cli in streaming mode (no-op when polling)
+        await self.signal.start()
+
         # Initial status update
-        self._update_status_in_memory()
+        await self._update_status_in_memory_async()
 
         # Startup notification (checks for crash before setting marker)
         await self._startup_check()
@@ -668,41 +1534,98 @@ class Orchestrator:
         # Set running marker AFTER crash detection
         self._set_running_marker()
 
+        # Run signal polling, health monitoring, and cleanup as INDEPENDENT tasks
+        # They don't block each other
+        workers = [
+            asyncio.ensure_future(self._signal_loop()),
+            asyncio.ensure_future(self._monitoring_loop()),
+        ]
+        background = [
+            asyncio.ensure_future(self._cleanup_loop()),
+            asyncio.ensure_future(self._session_flush_loop()),
+        ]
         try:
-            # Run signal polling, health monitoring, and cleanup as INDEPENDENT tasks
-            # They don't block each other
-            await asyncio.gather(
-                self._signal_loop(),
-                self._monitoring_loop(),
-                self._cleanup_loop(),
-            )
+            await self._shutdown_event.wait()
+
+            # Let workers and in-flight replies finish what they're doing (e.g. a
+            # signal-cli call mid-drain); background loops only ever sleep, and
+            # the final save happens below
+            await asyncio.wait(workers + list(self._handler_tasks), timeout=self.SHUTDOWN_GRACE)
         finally:
+            workers.extend(self._handler_tasks)
+            for task in workers + background:
+                task.cancel()
+            if self._shutdown_wait_task:
+                self._shutdown_wait_task.cancel()
+            await asyncio.gather(*workers, *background, return_exceptions=True)
+            await self.signal.close()
+            await close_claude_workers()
             # Clean shutdown - remove marker, skip message (can block if signal-cli hung)
             logger.info("Shutting down...")
+            self._save_sessions_now()
             self._clear_running_marker()
             self.memory.add_event("Clean shutdown")
+            self._io_executor.shutdown(wait=False, cancel_futures=True)
+
+    def request_shutdown(self):
+        """Ask the orchestrator to stop. Safe to call from a loop signal handler."""
+        self._shutdown_event.set()
+
+    async def _sleep_or_shutdown(self, seconds: float) -> bool:
+        """
+        Sleep for up to `seconds`, waking early on shutdown.
+
+        Returns:
+            True if shutdown was requested
+        """
+        # One long-lived waiter shared by every sleep, instead of a fresh
+        # wait_for task + TimeoutError per loop tick
+        if self._shutdown_wait_task is None:
+            self._shutdown_wait_task = asyncio.ensure_future(self._shutdown_event.wait())
+        done, _ = await asyncio.wait({self._shutdown_wait_task}, timeout=seconds)
+        return bool(done)
 
     async def _signal_loop(self):
         """Independent loop for Signal message polling."""
         logger.info("[SIGNAL LOOP] Started")
-        while True:
+        while not self._shutdown_event.is_set():
             try:
                 await self._process_messages()
             except Exception as e:
                 logger.error(f"[SIGNAL LOOP] Error: {e}")
-            await asyncio.sleep(self.poll_interval)
+            # Streaming receive already waits for messages - no need to sleep
+            if await self._sleep_or_shutdown(0 if self.signal.streaming else self.poll_interval):
+                break
 
     async def _monitoring_loop(self):
         """Independent loop for health monitoring."""
         logger.info("[MONITOR LOOP] Started")
         # Now independent from signal polling - can run frequently
         health_check_interval = self.config.get('health_check_interval', 10)
-        while True:
+        while not self._shutdown_event.is_set():
             try:
                 await self._smart_monitoring_check()
             except Exception as e:
                 logger.error(f"[MONITOR LOOP] Error: {e}")
-            await asyncio.sleep(health_check_interval)
+            if await self._sleep_or_shutdown(health_check_interval):
+                break
+
+    async def _session_flush_loop(self):
+        """Write session state at most once per SESSION_FLUSH_DELAY when it changes."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._sessions_dirty.wait()
+            await asyncio.sleep(self.SESSION_FLUSH_DELAY)
+            self._sessions_dirty.clear()
+            # Most Claude calls resume the same session - nothing new to write
+            state = self._session_state()
+            if state == self._saved_state:
+                continue
+            try:
+                await loop.run_in_executor(self._io_executor, self._write_sessions, self._session_snapshot())
+                self._saved_state = state
+            except Exception as e:
+                logger.error(f"[SESSION] Flush failed: {e}")
 
     async def _cleanup_loop(self):
         """
@@ -711,8 +1634,10 @@ class Orchestrator:
         Cleans up orphaned libsignal temp folders that can accumulate
         if the java.library.path fix stops working.
 
-        Runs hourly by default. If folders are found, logs a warning
-        as early detection that the permanent fix needs attention.
+        Runs hourly by default. With watchdog installed it instead reacts to
+        new folders as they appear, keeping only a daily sweep. If folders
+        are found, logs a warning as early detection that the permanent fix
+        needs attention.
         """
         # Configurable interval (default 1 hour)
         cleanup_interval = self.config.get('temp_cleanup_interval', 3600)
@@ -722,69 +1647,88 @@ class Orchestrator:
             logger.info("[CLEANUP LOOP] Disabled (temp_cleanup_interval <= 0)")
             return
 
-        logger.info(f"[CLEANUP LOOP] Started (interval: {cleanup_interval}s)")
+        # React to new libsignal folders when we can watch for them; the
+        # periodic sweep then only needs to run as a daily backstop
+        loop = asyncio.get_running_loop()
+        folder_created = asyncio.Event()
+        observer = watch_libsignal_temp_folders(lambda: loop.call_soon_threadsafe(folder_created.set))
+        if observer:
+            cleanup_interval = max(cleanup_interval, self.CLEANUP_WATCH_FALLBACK_INTERVAL)
+
+        logger.info(
+            f"[CLEANUP LOOP] Started (interval: {cleanup_interval}s"
+            f"{', watching temp dir' if observer else ''})"
+        )
 
-        # Run once at startup to catch any existing accumulation
-        cleanup_libsignal_temp_folders()
+        try:
+            # Run once at startup to catch any existing accumulation
+            await asyncio.to_thread(cleanup_libsignal_temp_folders)
 
-        while True:
-            await asyncio.sleep(cleanup_interval)
-            try:
-                result = cleanup_libsignal_temp_folders()
-                if result['warning']:
-                    # Also log to memory for visibility
-                    self.memory.add_event(
-                        f"Cleanup warning: found {result['checked']} libsignal temp folders, "
-                        f"deleted {result['deleted']}. Check java.library.path fix."
-                    )
-            except Exception as e:
-                logger.error(f"[CLEANUP LOOP] Error: {e}")
+            while True:
+                try:
+                    await asyncio.wait_for(folder_created.wait(), timeout=cleanup_interval)
+                    # New folder - wait until it's old enough to be deleted
+                    if await self._sleep_or_shutdown(LIBSIGNAL_MAX_AGE + 30):
+                        break
+                except asyncio.TimeoutError:
+                    pass
+                folder_created.clear()
+                try:
+                    result = await asyncio.to_thread(cleanup_libsignal_temp_folders)
+                    if result['warning']:
+                        # Also log to memory for visibility
+                        self.memory.add_event(
+                            f"Cleanup warning: found {result['checked']} libsignal temp folders, "
+                            f"deleted {result['deleted']}. Check java.library.path fix."
+                        )
+                except Exception as e:
+                    logger.error(f"[CLEANUP LOOP] Error: {e}")
+        finally:
+            if observer:
+                observer.stop()
 
     async def _process_messages(self):
         """Process incoming Signal messages."""
         messages = await self.signal.receive_messages()
 
         for msg in messages:
-            envelope = msg.get('envelope', msg)
-            timestamp = envelope.get('timestamp')
+            # Receipts and typing indicators (most of the traffic) carry no text -
+            # keep them out of the dedup cache and its saves
+            if not msg.text:
+                continue
 
+            timestamp = msg.timestamp
             if timestamp in self.processed_timestamps:
                 logger.debug(f"[DEDUP] Skipping already-processed message {timestamp}")
                 continue
-            self.processed_timestamps.add(timestamp)
-
-            # Trim processed set and persist (prevents duplicates on restart)
-            if len(self.processed_timestamps) > 1000:
-                self.processed_timestamps = set(list(self.processed_timestamps)[-500:])
-            self._save_sessions()  # Persist timestamps early to prevent duplicates on crash
+            self._remember_timestamp(timestamp)
+            # Persist in batches rather than per message; a crash replays at most a few
+            if (self._unsaved_ts >= self.TIMESTAMP_SAVE_BATCH
+                    or time.monotonic() - self._last_save > self.TIMESTAMP_SAVE_INTERVAL):
+                self._save_sessions()
 
             parsed = self.signal.extract_group_message(msg)
             if not parsed:
-                # Log why it was skipped
-                data_msg = envelope.get('dataMessage', {})
-                group_info = data_msg.get('groupInfo', {})
-                group_id = group_info.get('groupId', 'none')
-                text = data_msg.get('message', '')
-                if text:
-                    logger.debug(f"[SKIP] group={group_id[:20] if group_id else 'DM'}... not in allowed list or no text")
+                logger.debug(f"[SKIP] group={msg.group_id[:20] if msg.group_id else 'DM'}... not in allowed list")
                 continue
 
             group_id, sender, message_text, mentions = parsed
+            if self._is_double_delivery(timestamp, group_id, sender, message_text):
+                logger.info(f"[DEDUP] Skipping double delivery from {sender} (timestamp {timestamp}): {message_text[:100]}")
+                continue
             logger.info(f"[<- SIGNAL] from {sender}: {message_text}")
             if mentions:
                 logger.info(f"[MENTIONS] {len(mentions)} mention(s) detected")
 
             # Buffer all messages for context
             self.message_buffer.append({'sender': sender, 'text': message_text})
-            if len(self.message_buffer) > self.buffer_size:
-                self.message_buffer = self.message_buffer[-self.buffer_size:]
 
             # Check for @opus direct trigger (bypasses Sonnet)
-            direct_opus = 'opus' in message_text.lower()
+            direct_opus = _OPUS_PATTERN.search(message_text) is not None
 
             # Check trigger: mentions array OR literal trigger word
             has_mention = len(mentions) > 0
-            has_trigger_word = self.trigger_word and self.trigger_word in message_text.lower()
+            has_trigger_word = self._trigger_pattern is not None and self._trigger_pattern.search(message_text) is not None
 
             if not has_mention and not has_trigger_word:
                 logger.debug(f"[SKIP] no mention and no trigger word '{self.trigger_word}'")
@@ -792,60 +1736,110 @@ class Orchestrator:
 
             logger.info(f"[TRIGGERED] {'@opus direct' if direct_opus else 'via ' + ('mention' if has_mention else 'trigger word')}")
 
-            # Get context for prompt
-            status_lines = self._get_status_lines()
-            ops_log = self.memory.get_context_for_claude()
+            # Answer in the background - a slow Opus reply shouldn't hold up ingest
+            # or a quick Sonnet answer to the next message
+            task = asyncio.ensure_future(self._handle_one(group_id, message_text, direct_opus))
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
 
-            # Route to appropriate model
-            tool_summary = ""
+    async def _handle_one(self, group_id: str, message_text: str, direct_opus: bool):
+        """
+        Answer one triggered message: Claude call + reply.
 
-            if direct_opus:
-                # Direct Opus access - bypass Sonnet entirely
-                logger.info("[$$$ OPUS $$$] Direct Opus request")
+        At most max_concurrent_claude run at once. Calls resuming the same
+        model session are serialized so concurrent replies don't fork it.
+        """
+        async with self._inflight:
+            try:
+                await self._answer(group_id, message_text, direct_opus)
+            except Exception as e:
+                logger.error(f"[HANDLER] Failed to answer message: {e}")
 
-                response, self.opus_session_id, tool_summary = await call_claude_code(
-                    prompt=message_text,
-                    working_dir=self.project_path,
-                    model='opus',
-                    allowed_tools='Read,Edit,Write,Bash,Glob,Grep',
-                    timeout=120,
-                    session_id=self.opus_session_id
-                )
-                self._save_sessions()
-                model_used = 'opus'
+    async def _call_in_session(self, model: str, **kwargs) -> tuple[str, Optional[str], str]:
+        """
+        call_claude_code on the shared Sonnet/Opus session, one call per session at a time.
+
+        Two concurrent --resume calls on one session id fork it and the later
+        one's id wins, so every call that resumes a shared session goes through here.
+        """
+        attr = f'{model}_session_id'
+        async with self._session_locks[model]:
+            result = await call_claude_code(model=model, session_id=getattr(self, attr), **kwargs)
+            setattr(self, attr, result[1])
+        self._save_sessions()
+        return result
+
+    async def _answer(self, group_id: str, message_text: str, direct_opus: bool):
+        """Route a message to the right model and send the reply."""
+        # Prompts are the bare message - Claude reads ops-log.md and status via
+        # its tools and CLAUDE.md, so there's no context to gather here
+
+        # Route to appropriate model
+        tool_summary = ""
+
+        if direct_opus:
+            # Direct Opus access - bypass Sonnet entirely
+            logger.info("[$$$ OPUS $$$] Direct Opus request")
 
-            elif self.use_tiered_models:
-                # Tiered: Sonnet first, escalate to Opus if needed
-                response, model_used, self.sonnet_session_id, self.opus_session_id, tool_summary = await handle_message_tiered(
-                    message_text, status_lines, self.message_buffer, ops_log, self.project_path,
+            response, _, tool_summary = await self._call_in_session(
+                prompt=message_text,
+                working_dir=self.project_path,
+                model='opus',
+                allowed_tools='Read,Edit,Write,Bash,Glob,Grep',
+                timeout=120
+            )
+            model_used = 'opus'
+
+        elif self.use_tiered_models:
+            # Tiered: Sonnet first, escalate to Opus if needed
+            # Escalation goes through _call_in_session, so it waits for the Opus
+            # lock and resumes whatever the Opus session is by then
+            async with self._session_locks['sonnet']:
+                response, model_used, self.sonnet_session_id, _, tool_summary = await handle_message_tiered(
+                    message_text, self.project_path,
                     sonnet_session_id=self.sonnet_session_id,
-                    opus_session_id=self.opus_session_id
+                    escalate=self._call_in_session
                 )
-                self._save_sessions()
-                logger.info(f"Handled by {model_used}")
-            else:
-                # Legacy: always use Opus
-                response, self.opus_session_id, tool_summary = await call_claude_code(
-                    message_text, self.project_path, session_id=self.opus_session_id
-                )
-                self._save_sessions()
-                model_used = 'opus'
+            self._save_sessions()
+            logger.info(f"Handled by {model_used}")
+        else:
+            # Legacy: always use Opus
+            response, _, tool_summary = await self._call_in_session(
+                prompt=message_text, working_dir=self.project_path, model='opus'
+            )
+            model_used = 'opus'
+
+        # Log event
+        self.memory.add_event(f"Responded to: {message_text[:50]}...")
 
-            # Log event
-            self.memory.add_event(f"Responded to: {message_text[:50]}...")
+        # Send response with model attribution and tool summary
+        tools = f" [{tool_summary}]" if tool_summary else ""
+        tagged_response = f"{response}\n\n— {model_used}{tools}"
+        await self.signal.send_message(group_id, tagged_response)
+
+    async def _broadcast(self, message: str, dedup: bool = True):
+        """
+        Send a message to every allowed group concurrently, skipping repeats.
 
-            # Send response with model attribution and tool summary
-            attribution = f"— {model_used}"
-            if tool_summary:
-                attribution += f" [{tool_summary}]"
-            tagged_response = f"{response}\n\n{attribution}"
-            await self.signal.send_message(group_id, tagged_response)
+        Alerts pass dedup=False - a repeated "still broken" must always get through.
+        """
+        if dedup and self._seen_recently('out', message, window=self.BROADCAST_DEDUP_WINDOW):
+            logger.info(f"[BROADCAST] Identical message sent <{self.BROADCAST_DEDUP_WINDOW}s ago, skipping")
+            return
+        # return_exceptions: one failing group shouldn't stop the others
+        results = await asyncio.gather(
+            *(self.signal.send_message(gid, message) for gid in self.signal.allowed_group_ids),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"[BROADCAST] Send failed: {result}")
 
     async def _smart_monitoring_check(self):
         """Event-driven monitoring - only invoke Claude when interesting."""
         # Get current status from all monitors
         logger.debug("[MONITOR] Health check running...")
-        raw_status = self.health.get_all_status()
+        raw_status = await self.health.get_all_status_async()
         logger.debug("[MONITOR] Health check complete")
         flat_status = self.smart_monitor.flatten_status(raw_status)
 
@@ -857,8 +1851,8 @@ class Orchestrator:
 
         logger.info(f"Smart monitor triggered: {reason}")
 
-        # Update status in memory
-        self._update_status_in_memory()
+        # Update status in memory - from the snapshot we just took
+        await self._update_status_in_memory_async(raw_status)
 
         if reason == "verify_fix":
             # Verification check after Opus action
@@ -876,16 +1870,14 @@ class Orchestrator:
 
 If all good, say "All clear." Only message if something's off."""
 
-        response, self.sonnet_session_id, tool_summary = await call_claude_code(
+        response, _, tool_summary = await self._call_in_session(
             prompt=prompt,
             working_dir=self.project_path,
             model='sonnet',
             allowed_tools='Read,Glob,Grep',
             timeout=60,
-            session_id=self.sonnet_session_id,
             max_turns=5
         )
-        self._save_sessions()
 
         response_lower = response.lower().strip()
 
@@ -894,44 +1886,37 @@ If all good, say "All clear." Only message if something's off."""
             return
 
         # Format attribution
-        attribution = "— sonnet"
-        if tool_summary:
-            attribution += f" [{tool_summary}]"
+        attribution = f"— sonnet [{tool_summary}]" if tool_summary else "— sonnet"
 
-        # Alert - high priority
+        # Alert - high priority, always sent even if it repeats an earlier one
         if response_lower.startswith('alert:'):
             self.memory.add_event(f"Alert: {response[:200]}")
-            for group_id in self.signal.allowed_group_ids:
-                await self.signal.send_message(group_id, f"🚨 {response}\n\n{attribution}")
+            await self._broadcast(f"🚨 {response}\n\n{attribution}", dedup=False)
+        elif self._seen_recently('obs', response_lower, window=self.OBSERVATION_DEDUP_WINDOW):
+            logger.info(f"Sonnet repeated itself, not re-broadcasting: {response[:100]}")
         else:
             self.memory.add_event(f"Observation: {response[:200]}")
             logger.info(f"Sonnet observation: {response}")
-            for group_id in self.signal.allowed_group_ids:
-                await self.signal.send_message(group_id, f"{response}\n\n{attribution}")
+            await self._broadcast(f"{response}\n\n{attribution}")
 
     async def _verification_check(self, status: dict):
         """Verify that a recent Opus fix worked."""
         prompt = """Opus just made a fix. Did it work? Say "Fix verified" or "ALERT: still broken"."""
 
-        response, self.sonnet_session_id, tool_summary = await call_claude_code(
+        response, _, tool_summary = await self._call_in_session(
             prompt=prompt,
             working_dir=self.project_path,
             model='sonnet',
             allowed_tools='Read,Glob,Grep',
             timeout=60,
-            session_id=self.sonnet_session_id,
             max_turns=5
         )
-        self._save_sessions()
 
         self.memory.add_event(f"Verification: {response[:200]}")
 
         if 'alert:' in response.lower():
-            attribution = "— sonnet"
-            if tool_summary:
-                attribution += f" [{tool_summary}]"
-            for group_id in self.signal.allowed_group_ids:
-                await self.signal.send_message(group_id, f"🚨 {response}\n\n{attribution}")
+            attribution = f"— sonnet [{tool_summary}]" if tool_summary else "— sonnet"
+            await self._broadcast(f"🚨 {response}\n\n{attribution}", dedup=False)
 
     async def _startup_check(self):
         """
@@ -943,13 +1928,20 @@ If all good, say "All clear." Only message if something's off."""
 
         logger.info("Running startup check...")
 
-        # Check if this is a crash recovery by looking at ops-log
-        ops_log = self.memory.read()
-        is_crash_recovery = self._detect_crash_recovery(ops_log)
-
-        # Get current system status
-        status = self.health.get_all_status()
-        alerts = self.health.get_all_alerts()
+        # Check if this is a crash recovery (marker file left by an unclean exit)
+        is_crash_recovery = self._detect_crash_recovery()
+
+        # Get current system status - status, alerts and per-monitor lines in parallel.
+        # Alerts read each monitor's last status, already fresh from run()'s initial update.
+        names = list(self.health.monitors)
+        status, alerts, probe_results = await asyncio.gather(
+            self.health.get_all_status_async(),
+            self.health.get_all_alerts_async(),
+            asyncio.gather(
+                *(asyncio.to_thread(self._cached_status_line, name) for name in names),
+                return_exceptions=True
+            ),
+        )
 
         # Build startup message
         if is_crash_recovery:
@@ -958,16 +1950,13 @@ If all good, say "All clear." Only message if something's off."""
             lines = ["SUNFISH online\n"]
 
         # Check each monitor
-        for name, monitor in self.health.monitors.items():
-            try:
-                line = monitor.get_status_line()
-                monitor_status = status.get(name, {})
-                if monitor_status.get('healthy', True):
-                    lines.append(f"✓ {line}")
-                else:
-                    lines.append(f"✗ {line}")
-            except Exception as e:
-                lines.append(f"✗ {name}: error ({e})")
+        for name, line in zip(names, probe_results):
+            if isinstance(line, Exception):
+                lines.append(f"✗ {name}: error ({line})")
+            elif status.get(name, {}).get('healthy', True):
+                lines.append(f"✓ {line}")
+            else:
+                lines.append(f"✗ {line}")
 
         # Add any alerts
         if alerts:
@@ -978,13 +1967,13 @@ If all good, say "All clear." Only message if something's off."""
         message = "\n".join(lines)
 
         # Send to all groups
-        for group_id in self.signal.allowed_group_ids:
-            await self.signal.send_message(group_id, message)
+        await self._broadcast(message)
 
         # Log the startup appropriately
         if is_crash_recovery:
-            self.memory.add_event("CRASH RECOVERY - orchestrator restarted after unexpected shutdown")
-            self.memory.add_active_issue("Investigate recent crash - check logs/orchestrator.log")
+            with self.memory.batch():
+                self.memory.add_event("CRASH RECOVERY - orchestrator restarted after unexpected shutdown")
+                self.memory.add_active_issue("Investigate recent crash - check logs/orchestrator.log")
 
             # Have Sonnet analyze what might have caused the crash
             await self._analyze_crash()
@@ -995,7 +1984,7 @@ If all good, say "All clear." Only message if something's off."""
         if alerts and self.config.get('auto_recovery', False):
             await self._attempt_auto_recovery(alerts)
 
-    def _detect_crash_recovery(self, ops_log: str) -> bool:
+    def _detect_crash_recovery(self) -> bool:
         """
         Detect if this startup is recovering from a crash.
 
@@ -1003,9 +1992,7 @@ If all good, say "All clear." Only message if something's off."""
         - .running file exists on startup = previous instance didn't shut down cleanly
         - Clean shutdown removes the file
         """
-        marker_file = self.project_path / ".running"
-
-        if marker_file.exists():
+        if self.marker_file.exists():
             # Previous instance didn't clean up - was a crash
             logger.info("Crash marker found - previous instance didn't shut down cleanly")
             return True
@@ -1014,18 +2001,15 @@ If all good, say "All clear." Only message if something's off."""
 
     def _set_running_marker(self):
         """Create marker file indicating we're running."""
-        marker_file = self.project_path / ".running"
         try:
-            marker_file.write_text(f"Started: {datetime.now().isoformat()}")
+            self.marker_file.write_text(f"Started: {datetime.now().isoformat()}")
         except Exception as e:
             logger.warning(f"Could not create running marker: {e}")
 
     def _clear_running_marker(self):
         """Remove marker file on clean shutdown."""
-        marker_file = self.project_path / ".running"
         try:
-            if marker_file.exists():
-                marker_file.unlink()
+            self.marker_file.unlink(missing_ok=True)
         except Exception as e:
             logger.warning(f"Could not remove running marker: {e}")
 
@@ -1035,22 +2019,21 @@ If all good, say "All clear." Only message if something's off."""
 
         prompt = """System crashed and restarted. Quick take - what happened?"""
 
-        response, self.sonnet_session_id, _ = await call_claude_code(
+        response, _, _ = await self._call_in_session(
             prompt=prompt,
             working_dir=self.project_path,
             model='sonnet',
             allowed_tools='Read,Glob,Grep',
             timeout=60,
-            session_id=self.sonnet_session_id,
             max_turns=5
         )
-        self._save_sessions()
 
         logger.info(f"Crash analysis: {response}")
-        self.memory.add_event(f"Crash analysis: {response[:250]}")
+        with self.memory.batch():
+            self.memory.add_event(f"Crash analysis: {response[:250]}")
 
-        if 'unknown' not in response.lower():
-            self.memory.add_to_history(f"Crash on {datetime.now().strftime('%m/%d')}: {response[:150]}")
+            if 'unknown' not in response.lower():
+                self.memory.add_to_history(f"Crash on {datetime.now().strftime('%m/%d')}: {response[:150]}")
 
     async def _attempt_auto_recovery(self, alerts: list[str]):
         """
@@ -1059,63 +2042,92 @@ If all good, say "All clear." Only message if something's off."""
         """
         logger.info("Attempting auto-recovery...")
 
-        alerts_text = "\n".join([f"- {a}" for a in alerts])
+        alerts_text = bullet_join(alerts)
 
         prompt = f"""System restarted with issues: {alerts_text}
 
 Fix what you can and let us know what you did."""
 
-        response, self.opus_session_id, _ = await call_claude_code(
+        response, _, _ = await self._call_in_session(
             prompt=prompt,
             working_dir=self.project_path,
             model='opus',
             allowed_tools='Read,Edit,Write,Bash,Glob,Grep',
-            timeout=120,
-            session_id=self.opus_session_id
+            timeout=120
         )
-        self._save_sessions()
 
         self.memory.add_event(f"Auto-recovery: {response[:200]}")
 
-        for group_id in self.signal.allowed_group_ids:
-            await self.signal.send_message(group_id, f"🔧 Auto-recovery:\n{response}\n\n— opus")
+        await self._broadcast(f"🔧 Auto-recovery:\n{response}\n\n— opus")
 
         self.smart_monitor.schedule_verification()
 
-    def _get_status_lines(self) -> list[str]:
-        """Get current status as a list of one-liner strings."""
-        lines = []
-        for name, monitor in self.health.monitors.items():
-            try:
-                lines.append(monitor.get_status_line())
-            except Exception as e:
-                lines.append(f"{name}: error ({e})")
+    def _status_line(self, name: str, status: Optional[dict] = None) -> str:
+        """One monitor's status line, with probe errors rendered inline."""
+        try:
+            return self._cached_status_line(name, status)
+        except Exception as e:
+            return f"{name}: error ({e})"
 
-        # Add OpenRouter balance
-        balance = check_openrouter_balance()
-        if balance is not None:
-            lines.append(f"OpenRouter: ${balance:.2f} remaining")
-            logger.info(f"[BALANCE] OpenRouter: ${balance:.2f}")
+    def _cached_status_line(self, name: str, status: Optional[dict] = None) -> str:
+        """
+        One monitor's status line, probed at most once per STATUS_LINE_TTL.
 
-        return lines
+        Lets the startup check reuse the lines run()'s initial ops-log update just
+        probed. A status passed in (from a probe that just ran) is formatted and refreshes the cache. Errors aren't
+        cached, so a failing monitor is retried next time. Safe to call from worker threads.
+        """
+        if status is None:
+            cached = self._status_line_cache.get(name)
+            if cached and time.monotonic() - cached[0] < self.STATUS_LINE_TTL:
+                return cached[1]
+        line = self.health.get_status_line(name, status)
+        self._status_line_cache[name] = (time.monotonic(), line)
+        return line
+
+    def _update_status_in_memory(self, raw_status: Optional[dict] = None):
+        """
+        Update the status section in ops-log.md.
 
-    def _update_status_in_memory(self):
-        """Update the status section in ops-log.md."""
+        Formats raw_status (a get_all_status() result) when given, rather than
+        probing every monitor again. Monitors whose probe failed are retried.
+        """
+        raw_status = raw_status or {}
         try:
-            status_lines = []
-            for name, monitor in self.health.monitors.items():
-                status_lines.append(monitor.get_status_line())
-
-            status_text = "\n".join(f"- {line}" for line in status_lines)
-            self.memory.update_status_section(status_text)
+            lines = []
+            for name in self.health.monitors:
+                status = raw_status.get(name)
+                if status and 'error' in status:
+                    status = None
+                lines.append(self._status_line(name, status))
+            self.memory.update_status_section(bullet_join(lines))
         except Exception as e:
             logger.error(f"Failed to update status: {e}")
 
+    async def _update_status_in_memory_async(self, raw_status: Optional[dict] = None):
+        """Update the status section in ops-log.md without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io_executor, self._update_status_in_memory, raw_status)
+
 
 # =============================================================================
 # Entry Point
 # =============================================================================
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the orchestrator's event loop.
+
+    Uses uvloop when installed, and eager task execution (Python 3.12+):
+    gather() over coroutines that finish without real I/O completes in place
+    instead of paying an event-loop round-trip per task.
+    """
+    loop = uvloop.new_event_loop() if HAS_UVLOOP else asyncio.new_event_loop()
+    if hasattr(asyncio, 'eager_task_factory'):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
 def main():
     """
     Main entry point with graceful shutdown handling.
@@ -1123,8 +2135,7 @@ def main():
     - First Ctrl+C: Attempts graceful shutdown (5 second timeout)
     - Second Ctrl+C or timeout: Forces immediate exit
     """
-    import threading
-
+    _start_log_listener()
     config = load_config()
     orchestrator = Orchestrator(config)
 
@@ -1135,10 +2146,11 @@ def main():
     def force_exit():
         """Force exit - called by timer or second interrupt."""
         logger.warning("Forcing exit")
+        _stop_log_listener()  # os._exit skips atexit - flush the queue by hand
         os._exit(1)
 
-    def signal_handler(signum, frame):
-        """Handle Ctrl+C BEFORE asyncio gets it."""
+    def on_interrupt():
+        """First interrupt starts the force-exit timer, second exits immediately."""
         nonlocal shutting_down, shutdown_timer
 
         if shutting_down:
@@ -1154,14 +2166,35 @@ def main():
         shutdown_timer.daemon = True
         shutdown_timer.start()
 
+    def signal_handler(signum, frame):
+        """Windows: handle Ctrl+C BEFORE asyncio gets it."""
+        on_interrupt()
         # Raise KeyboardInterrupt to stop asyncio.run()
         raise KeyboardInterrupt
 
-    # Install signal handler BEFORE asyncio.run() so we control shutdown
-    signal.signal(signal.SIGINT, signal_handler)
+    def loop_signal_handler():
+        """POSIX: runs on the event loop, so shutdown never interrupts a frame mid-write."""
+        on_interrupt()
+        orchestrator.request_shutdown()
+
+    async def run():
+        if os.name != 'nt':
+            loop = asyncio.get_running_loop()
+            loop.add_signal_handler(signal.SIGINT, loop_signal_handler)
+            loop.add_signal_handler(signal.SIGTERM, loop_signal_handler)
+        await orchestrator.run()
+
+    # Windows has no loop.add_signal_handler - install ours BEFORE asyncio.run()
+    if os.name == 'nt':
+        signal.signal(signal.SIGINT, signal_handler)
 
     try:
-        asyncio.run(orchestrator.run())
+        if sys.version_info >= (3, 12):
+            asyncio.run(run(), loop_factory=_new_event_loop)
+        else:
+            if HAS_UVLOOP:
+                uvloop.install()
+            asyncio.run(run())
     except KeyboardInterrupt:
         # Graceful shutdown initiated by our signal handler
         # Timer is already running - just wait for cleanup or force exit
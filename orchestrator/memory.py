@@ -15,14 +15,16 @@ import logging
 import threading
 import tempfile
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
 import re
 
 logger = logging.getLogger(__name__)
 
-# Thread lock for file operations
-_file_lock = threading.Lock()
+# Thread lock for file operations - reentrant so read-modify-write helpers can
+# hold it across their own read() and write()
+_file_lock = threading.RLock()
 
 DEFAULT_OPS_LOG = """# Ops Log
 
@@ -78,6 +80,12 @@ class MemoryManager:
         self.ops_log_path = self.project_path / "ops-log.md"
         self.max_recent_events = max_recent_events
         self.max_event_age_hours = max_event_age_hours
+        # Pending content while a batch() is open - per thread, so a batch
+        # never swallows another thread's writes
+        self._local = threading.local()
+        # ((mtime_ns, size), content) of the last read/write - Opus edits the
+        # file directly, so the stat key is what invalidates it
+        self._cache: tuple[tuple[int, int], str] | None = None
         self._ensure_exists()
 
     def _ensure_exists(self):
@@ -87,11 +95,45 @@ class MemoryManager:
             self.ops_log_path.write_text(DEFAULT_OPS_LOG)
             logger.info(f"Created ops-log.md at {self.ops_log_path}")
 
+    @contextmanager
+    def batch(self):
+        """
+        Group several updates into a single ops-log.md rewrite.
+
+        Inside the block, reads see the pending content and writes replace it;
+        the file is written once on exit. Nested batches join the outer one.
+        Holds the file lock for the whole block, so keep batches short - other
+        threads' updates wait rather than being overwritten by the pending content.
+        """
+        if getattr(self._local, 'batch', None) is not None:
+            yield
+            return
+
+        with _file_lock:
+            self._local.batch = [None]
+            try:
+                yield
+            finally:
+                pending = self._local.batch[0]
+                self._local.batch = None
+                if pending is not None:
+                    self.write(pending)
+
     def read(self) -> str:
         """Read the current ops log (thread-safe)."""
+        batch = getattr(self._local, 'batch', None)
+        if batch is not None and batch[0] is not None:
+            return batch[0]
+
         with _file_lock:
             try:
-                return self.ops_log_path.read_text(encoding='utf-8')
+                st = os.stat(self.ops_log_path)
+                key = (st.st_mtime_ns, st.st_size)
+                if self._cache and self._cache[0] == key:
+                    return self._cache[1]
+                content = self.ops_log_path.read_text(encoding='utf-8')
+                self._cache = (key, content)
+                return content
             except UnicodeDecodeError:
                 # Windows encoding fallback - try to recover
                 try:
@@ -109,7 +151,12 @@ class MemoryManager:
                 return DEFAULT_OPS_LOG
 
     def write(self, content: str):
-        """Write the entire ops log (atomic, thread-safe)."""
+        """Write the entire ops log (atomic, thread-safe). Deferred inside batch()."""
+        batch = getattr(self._local, 'batch', None)
+        if batch is not None:
+            batch[0] = content
+            return
+
         with _file_lock:
             try:
                 # Atomic write: write to temp file, then rename
@@ -121,21 +168,32 @@ class MemoryManager:
                 if self.ops_log_path.exists():
                     self.ops_log_path.unlink()
                 temp_path.rename(self.ops_log_path)
+
+                st = os.stat(self.ops_log_path)
+                self._cache = ((st.st_mtime_ns, st.st_size), content)
             except Exception as e:
+                self._cache = None
                 logger.error(f"Failed to write ops-log: {e}")
 
     def get_context_for_claude(self) -> str:
-        """Get the ops log, auto-trimming old events first."""
-        self._trim_old_events()
-        return self.read()
+        """Get the ops log, auto-trimming old events first (thread-safe)."""
+        # Callers run this off the loop thread - keep the trim and the read
+        # together so the trim can't clobber an event added in between
+        with _file_lock:
+            self._trim_old_events()
+            return self.read()
 
     # =========================================================================
     # Section Updates
     # =========================================================================
 
     def update_status_section(self, status_text: str):
-        """Update the Current Status section."""
-        self._update_section('status', status_text)
+        """Update the Current Status section, trimming aged-out events in the same write."""
+        # The periodic status refresh is the maintenance tick - nothing else reads
+        # the log through get_context_for_claude() on a schedule
+        with self.batch():
+            self._update_section('status', status_text)
+            self._trim_old_events()
 
     def add_event(self, event: str):
         """
@@ -145,36 +203,37 @@ class MemoryManager:
         timestamp = datetime.now().strftime("%m/%d %H:%M")
         event_line = f"- {timestamp} - {event}"
 
-        content = self.read()
-        lines = content.split('\n')
-        new_lines = []
-        in_events = False
-        events_added = False
-        event_count = 0
-
-        for line in lines:
-            if self.SECTIONS['events'] in line:
-                in_events = True
-                new_lines.append(line)
-                new_lines.append(event_line)  # Add new event at top
-                events_added = True
-                continue
-
-            if in_events:
-                if line.startswith('## '):  # Next section
-                    in_events = False
+        with _file_lock:
+            content = self.read()
+            lines = content.split('\n')
+            new_lines = []
+            in_events = False
+            events_added = False
+            event_count = 0
+
+            for line in lines:
+                if self.SECTIONS['events'] in line:
+                    in_events = True
                     new_lines.append(line)
-                elif line.startswith('- '):
-                    event_count += 1
-                    if event_count < self.max_recent_events:
+                    new_lines.append(event_line)  # Add new event at top
+                    events_added = True
+                    continue
+
+                if in_events:
+                    if line.startswith('## '):  # Next section
+                        in_events = False
+                        new_lines.append(line)
+                    elif line.startswith('- '):
+                        event_count += 1
+                        if event_count < self.max_recent_events:
+                            new_lines.append(line)
+                        # Skip if over limit
+                    else:
                         new_lines.append(line)
-                    # Skip if over limit
                 else:
                     new_lines.append(line)
-            else:
-                new_lines.append(line)
 
-        self.write('\n'.join(new_lines))
+            self.write('\n'.join(new_lines))
 
     def add_active_issue(self, issue: str):
         """Add an issue to Active Issues."""
@@ -190,26 +249,27 @@ class MemoryManager:
 
     def resolve_issue(self, issue_fragment: str):
         """Remove an issue containing the given text."""
-        content = self.read()
-        lines = content.split('\n')
-        new_lines = []
-        removed = False
+        with _file_lock:
+            content = self.read()
+            lines = content.split('\n')
+            new_lines = []
+            removed = False
+
+            for line in lines:
+                if issue_fragment.lower() in line.lower() and line.strip().startswith('- ['):
+                    removed = True
+                    continue
+                new_lines.append(line)
 
-        for line in lines:
-            if issue_fragment.lower() in line.lower() and line.strip().startswith('- ['):
-                removed = True
-                continue
-            new_lines.append(line)
-
-        if removed:
-            # Add placeholder if no issues left
-            result = '\n'.join(new_lines)
-            if '## Active Issues\n\n##' in result or '## Active Issues\n##' in result:
-                result = result.replace(
-                    '## Active Issues\n',
-                    '## Active Issues\n_None currently_\n'
-                )
-            self.write(result)
+            if removed:
+                # Add placeholder if no issues left
+                result = '\n'.join(new_lines)
+                if '## Active Issues\n\n##' in result or '## Active Issues\n##' in result:
+                    result = result.replace(
+                        '## Active Issues\n',
+                        '## Active Issues\n_None currently_\n'
+                    )
+                self.write(result)
 
     def add_to_history(self, learning: str):
         """Add a learning to History Summary."""
@@ -226,33 +286,36 @@ class MemoryManager:
 
     def _trim_old_events(self):
         """Remove events older than max_event_age_hours."""
-        content = self.read()
-        lines = content.split('\n')
-        new_lines = []
-        in_events = False
-        cutoff = datetime.now() - timedelta(hours=self.max_event_age_hours)
-
-        for line in lines:
-            if self.SECTIONS['events'] in line:
-                in_events = True
-                new_lines.append(line)
-                continue
-
-            if in_events:
-                if line.startswith('## '):  # Next section
-                    in_events = False
+        with _file_lock:
+            content = self.read()
+            lines = content.split('\n')
+            new_lines = []
+            in_events = False
+            cutoff = datetime.now() - timedelta(hours=self.max_event_age_hours)
+
+            for line in lines:
+                if self.SECTIONS['events'] in line:
+                    in_events = True
                     new_lines.append(line)
-                elif line.startswith('- '):
-                    # Try to parse timestamp
-                    if self._is_event_recent(line, cutoff):
+                    continue
+
+                if in_events:
+                    if line.startswith('## '):  # Next section
+                        in_events = False
+                        new_lines.append(line)
+                    elif line.startswith('- '):
+                        # Try to parse timestamp
+                        if self._is_event_recent(line, cutoff):
+                            new_lines.append(line)
+                        # Skip old events
+                    else:
                         new_lines.append(line)
-                    # Skip old events
                 else:
                     new_lines.append(line)
-            else:
-                new_lines.append(line)
 
-        self.write('\n'.join(new_lines))
+            # Usually nothing has aged out - don't rewrite the file for nothing
+            if len(new_lines) != len(lines):
+                self.write('\n'.join(new_lines))
 
     def _is_event_recent(self, line: str, cutoff: datetime) -> bool:
         """Check if an event line is more recent than cutoff."""
@@ -316,56 +379,60 @@ Format your response as bullet points starting with "- " """
     def _update_section(self, section_key: str, content: str):
         """Replace content of a section."""
         marker = self.SECTIONS[section_key]
-        full_content = self.read()
-        lines = full_content.split('\n')
-        new_lines = []
-        in_section = False
-        content_added = False
-
-        for line in lines:
-            if marker in line:
-                in_section = True
-                new_lines.append(line)
-                new_lines.append(content)
-                content_added = True
-                continue
-
-            if in_section:
-                if line.startswith('## '):  # Next section
-                    in_section = False
-                    if not content_added:
-                        new_lines.append(content)
-                    new_lines.append('')  # Blank line before next section
+        with _file_lock:
+            full_content = self.read()
+            lines = full_content.split('\n')
+            new_lines = []
+            in_section = False
+            content_added = False
+
+            for line in lines:
+                if marker in line:
+                    in_section = True
+                    new_lines.append(line)
+                    new_lines.append(content)
+                    content_added = True
+                    continue
+
+                if in_section:
+                    if line.startswith('## '):  # Next section
+                        in_section = False
+                        if not content_added:
+                            new_lines.append(content)
+                        new_lines.append('')  # Blank line before next section
+                        new_lines.append(line)
+                    # Skip old content in this section
+                else:
                     new_lines.append(line)
-                # Skip old content in this section
-            else:
-                new_lines.append(line)
 
-        self.write('\n'.join(new_lines))
+            new_content = '\n'.join(new_lines)
+            if new_content != full_content:
+                self.write(new_content)
 
     def _insert_after_section(self, section_key: str, line: str, after_description: bool = False):
         """Insert a line at the start of a section's content."""
         marker = self.SECTIONS[section_key]
-        content = self.read()
-        lines = content.split('\n')
-        new_lines = []
-        inserted = False
-
-        for i, current_line in enumerate(lines):
-            new_lines.append(current_line)
-
-            if marker in current_line and not inserted:
-                # Skip description line if needed
-                if after_description:
-                    # Look for next non-empty line that's not a list item
-                    for j in range(i + 1, min(i + 3, len(lines))):
-                        if lines[j].strip() and not lines[j].startswith('- '):
-                            new_lines.append(lines[j])
-                            continue
-                new_lines.append(line)
-                inserted = True
+        with _file_lock:
+            content = self.read()
+            lines = content.split('\n')
+            new_lines = []
+            inserted = False
+
+            for i, current_line in enumerate(lines):
+                new_lines.append(current_line)
+
+                if marker in current_line and not inserted:
+                    # Skip description line if needed
+                    if after_description:
+                        # Look for next non-empty line that's not a list item
+                        for j in range(i + 1, min(i + 3, len(lines))):
+                            if lines[j].strip() and not lines[j].startswith('- '):
+                                new_lines.append(lines[j])
+                                continue
+                    new_lines.append(line)
+                    inserted = True
 
-        self.write('\n'.join(new_lines))
+            self.write('\n'.join(new_lines))
 
     def _extract_section_content(self, section_key: str) -> str:
         """Extract content between section header and next section."""
@@ -70,9 +70,9 @@ class AgentMonitor(BaseMonitor):
 
         return alerts
 
-    def get_status_line(self) -> str:
-        """One-line summary."""
-        s = self.get_status()
+    def get_status_line(self, status: Optional[dict] = None) -> str:
+        """One-line summary (of `status` if given, else a fresh probe)."""
+        s = status if status is not None else self.get_status()
 
         parts = []
 
@@ -9,6 +9,7 @@ To create a new monitor:
 5. Add config section in settings.yaml
 """
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Any, Optional
 
@@ -29,6 +30,9 @@ class BaseMonitor(ABC):
         self.enabled = config.get('enabled', True)
         self.alerts_config = config.get('alerts', {})
         self._last_status: dict = {}
+        # Held by callers probing from worker threads - monitors may share one
+        # connection (e.g. OBS websocket) that can't take concurrent requests
+        self.lock = threading.RLock()
 
     @abstractmethod
     def get_status(self) -> dict:
@@ -66,12 +70,16 @@ class BaseMonitor(ABC):
             'message': f"Monitor '{self.name}' does not support commands"
         }
 
-    def get_status_line(self) -> str:
+    def get_status_line(self, status: Optional[dict] = None) -> str:
         """
         Get a one-line status summary for Claude's context.
         Override for custom formatting.
+
+        Args:
+            status: A get_status() result to format instead of probing again
         """
-        status = self.get_status()
+        if status is None:
+            status = self.get_status()
         if not status:
             return f"{self.name}: unavailable"
         return f"{self.name}: {status}"
@@ -7,6 +7,7 @@ Requires OBS WebSocket plugin (built into OBS 28+).
 import json
 import hashlib
 import base64
+from typing import Optional
 from .base import BaseMonitor
 
 # Optional import - graceful degradation if not installed
@@ -152,9 +153,9 @@ class OBSMonitor(BaseMonitor):
 
         return alerts
 
-    def get_status_line(self) -> str:
-        """One-line summary."""
-        s = self.get_status()
+    def get_status_line(self, status: Optional[dict] = None) -> str:
+        """One-line summary (of `status` if given, else a fresh probe)."""
+        s = status if status is not None else self.get_status()
         if s.get('error'):
             return f"OBS: {s['error']}"
 
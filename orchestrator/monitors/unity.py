@@ -10,6 +10,7 @@ Possible approaches:
 4. Named pipes / IPC
 """
 
+from typing import Optional
 from .base import BaseMonitor
 
 
@@ -43,9 +44,9 @@ class UnityMonitor(BaseMonitor):
             'status': 'not_configured'
         }
 
-    def get_status_line(self) -> str:
-        """One-line summary."""
-        s = self.get_status()
+    def get_status_line(self, status: Optional[dict] = None) -> str:
+        """One-line summary (of `status` if given, else a fresh probe)."""
+        s = status if status is not None else self.get_status()
         if s.get('status') == 'not_configured':
             return "Unity: Not configured"
 
@@ -6,6 +6,7 @@ Works on Windows Server with NVIDIA GPU.
 
 import subprocess
 import platform
+from typing import Optional
 from .base import BaseMonitor
 
 
@@ -74,9 +75,9 @@ class VPSMonitor(BaseMonitor):
 
         return alerts
 
-    def get_status_line(self) -> str:
-        """One-line summary."""
-        s = self.get_status()
+    def get_status_line(self, status: Optional[dict] = None) -> str:
+        """One-line summary (of `status` if given, else a fresh probe)."""
+        s = status if status is not None else self.get_status()
         gpu = s.get('gpu', {})
         gpu_str = f"GPU {gpu.get('utilization', '?')}% @ {gpu.get('temp', '?')}C" if gpu else "GPU: N/A"
         return f"VPS: CPU {s.get('cpu_percent', '?')}%, RAM {s.get('memory_percent', '?')}%, Disk {s.get('disk_percent', '?')}%, {gpu_str}"
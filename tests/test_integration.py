@@ -103,6 +103,574 @@ def test_ops_log_structure():
     return True
 
 
+def test_memory_batch_single_write():
+    """Test that updates inside MemoryManager.batch() rewrite ops-log.md once."""
+    print("\n[TEST] ops-log batch writes...")
+
+    from memory import MemoryManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        memory = MemoryManager(Path(tmpdir))
+
+        writes = []
+        write_file = memory.write
+        def counting_write(content):
+            if getattr(memory._local, 'batch', None) is None:
+                writes.append(1)
+            write_file(content)
+        memory.write = counting_write
+
+        with memory.batch():
+            memory.add_event("first")
+            memory.add_event("second")
+            memory.update_status_section("- all good")
+            assert "second" in memory.read(), "Reads inside a batch should see pending updates"
+            assert "second" not in (Path(tmpdir) / "ops-log.md").read_text(), "Batch wrote early"
+
+        content = (Path(tmpdir) / "ops-log.md").read_text()
+        assert len(writes) == 1, f"Expected 1 write for the batch, got {len(writes)}"
+        assert "first" in content and "second" in content and "- all good" in content, "Batched updates lost"
+
+    print("  PASS: 3 updates -> 1 write")
+    return True
+
+
+def test_memory_read_cache_and_noop_writes():
+    """Test that ops-log reads are served from cache until the file changes, and no-op updates don't write."""
+    print("\n[TEST] ops-log read cache...")
+
+    import os
+    from memory import MemoryManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        memory = MemoryManager(Path(tmpdir))
+        ops_log = Path(tmpdir) / "ops-log.md"
+
+        memory.update_status_section("- all good")
+        first = ops_log.stat().st_mtime_ns
+        memory.update_status_section("- all good")
+        memory.get_context_for_claude()  # nothing old enough to trim
+        assert ops_log.stat().st_mtime_ns == first, "Unchanged status/trim rewrote ops-log.md"
+
+        # An outside edit (Opus writes the file directly) must be picked up
+        ops_log.write_text(ops_log.read_text() + "\nedited by opus\n")
+        os.utime(ops_log, ns=(first + 10**9, first + 10**9))
+        assert "edited by opus" in memory.read(), "Stale cache after external edit"
+
+    print("  PASS: no-op updates skipped, external edits invalidate the cache")
+    return True
+
+
+def test_status_update_trims_old_events():
+    """Test that the periodic status update also trims aged-out events, in one write."""
+    print("\n[TEST] Status update trims old events...")
+
+    from datetime import datetime, timedelta
+    from memory import MemoryManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        memory = MemoryManager(Path(tmpdir))
+        memory.add_event("fresh event")
+        old = (datetime.now() - timedelta(days=2)).strftime("%m/%d %H:%M")
+        memory.write(memory.read().replace("- System initialized", f"- {old} - ancient event"))
+
+        memory.update_status_section("- all good")
+        content = (Path(tmpdir) / "ops-log.md").read_text()
+
+    assert "ancient event" not in content, "Old event survived the status update"
+    assert "fresh event" in content and "- all good" in content, "Status update lost content"
+
+    print("  PASS: old events trimmed alongside the status update")
+    return True
+
+
+def test_memory_concurrent_updates_not_lost():
+    """Test that status updates, context trims and batches on worker threads don't drop each other's writes."""
+    print("\n[TEST] ops-log concurrent updates...")
+
+    import threading
+    from memory import MemoryManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        memory = MemoryManager(Path(tmpdir), max_recent_events=500)
+
+        def add_events():
+            for i in range(100):
+                memory.add_event(f"event-{i}")
+
+        def update_status():
+            for i in range(100):
+                memory.update_status_section(f"- check {i}")
+
+        def read_context():
+            for _ in range(100):
+                memory.get_context_for_claude()
+
+        def add_batched():
+            for i in range(50):
+                with memory.batch():
+                    memory.add_event(f"batched-{i}")
+                    memory.update_status_section(f"- batch {i}")
+
+        threads = [threading.Thread(target=fn) for fn in (add_events, update_status, read_context, add_batched)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        content = memory.read()
+        logged = {line.rsplit(' - ', 1)[-1] for line in content.split('\n')}
+        missing = [i for i in range(100) if f"event-{i}" not in logged]
+        assert not missing, f"{len(missing)} events lost to concurrent status updates"
+        missing = [i for i in range(50) if f"batched-{i}" not in logged]
+        assert not missing, f"{len(missing)} batched events lost"
+        assert "- check 99" in content or "- batch 49" in content, "Final status update lost"
+
+    print("  PASS: events, status updates, context reads and batches in parallel, nothing lost")
+    return True
+
+
+def _make_orchestrator(tmpdir: str, **overrides):
+    """Build an Orchestrator against a temp project dir with no monitors."""
+    from main import Orchestrator
+
+    config = {
+        'signal': {'phone_number': '+15550000000', 'allowed_group_ids': ['group-a']},
+        'project_path': tmpdir,
+        'monitors': {},
+        'startup_notification': False,
+    }
+    config.update(overrides)
+    return Orchestrator(config)
+
+
+def test_dedup_cache_eviction():
+    """Test that the dedup cache evicts oldest timestamps first and survives a reload."""
+    print("\n[TEST] Dedup cache eviction...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orch = _make_orchestrator(tmpdir)
+        limit = orch.MAX_PROCESSED_TIMESTAMPS
+
+        for ts in range(limit + 10):
+            orch._remember_timestamp(ts)
+
+        assert len(orch.processed_timestamps) == limit, f"Cache grew past {limit}"
+        assert 0 not in orch.processed_timestamps, "Oldest timestamp should be evicted"
+        assert limit + 9 in orch.processed_timestamps, "Newest timestamp missing"
+
+        orch._save_sessions_now()
+        reloaded = _make_orchestrator(tmpdir)
+        assert limit + 9 in reloaded.processed_timestamps, "Newest timestamp lost across restart"
+        assert 9 not in reloaded.processed_timestamps, "Persisted cache should keep the newest entries"
+
+    print("  PASS: Oldest timestamps evicted, newest persisted")
+    return True
+
+
+def test_session_saves_are_debounced():
+    """Test that a burst of _save_sessions calls results in a single disk write."""
+    print("\n[TEST] Session save debounce...")
+
+    import asyncio
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orch = _make_orchestrator(tmpdir)
+        orch.SESSION_FLUSH_DELAY = 0.05
+
+        writes = []
+        write = orch._write_sessions
+        orch._write_sessions = lambda data: (writes.append(1), write(data))
+
+        async def run():
+            flusher = asyncio.create_task(orch._session_flush_loop())
+            for i in range(5):
+                orch.sonnet_session_id = f"session-{i}"
+                orch._save_sessions()
+            await asyncio.sleep(0.3)
+            flusher.cancel()
+
+        asyncio.run(run())
+
+        assert len(writes) == 1, f"Expected 1 write for a burst, got {len(writes)}"
+        saved = json.loads((Path(tmpdir) / ".sessions.json").read_text())
+        assert saved['sonnet'] == 'session-4', f"Latest session not saved: {saved['sonnet']}"
+
+        # Same session resumed again - nothing changed, nothing to write
+        async def run_unchanged():
+            flusher = asyncio.create_task(orch._session_flush_loop())
+            orch._save_sessions()
+            await asyncio.sleep(0.3)
+            flusher.cancel()
+
+        asyncio.run(run_unchanged())
+        assert len(writes) == 1, f"Unchanged state should not be rewritten, got {len(writes)} writes"
+
+    print("  PASS: 5 saves in a burst -> 1 write with the latest state, unchanged -> none")
+    return True
+
+
+def test_timestamp_saves_are_batched():
+    """Test that a burst of inbound messages marks sessions dirty per batch, not per message."""
+    print("\n[TEST] Timestamp save batching...")
+
+    import asyncio
+    from main import ParsedMessage
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orch = _make_orchestrator(tmpdir)
+
+        saves = []
+        orch._save_sessions = lambda: (saves.append(1), orch._session_snapshot())
+
+        # 25 direct messages - deduped and then skipped as non-group, plus receipts
+        # (no text) that shouldn't touch the dedup cache at all
+        messages = [ParsedMessage(1000 + i, None, '+15551111111', f"dm {i}", []) for i in range(25)]
+        messages += [ParsedMessage(2000 + i, None, '+15551111111', None, []) for i in range(10)]
+
+        async def receive():
+            return messages
+        orch.signal.receive_messages = receive
+
+        asyncio.run(orch._process_messages())
+
+        assert len(saves) == 2, f"Expected 2 batched saves for 25 messages, got {len(saves)}"
+        assert orch._unsaved_ts == 5, f"Expected 5 pending timestamps, got {orch._unsaved_ts}"
+        assert len(orch.processed_timestamps) == 25, "All timestamps should still be deduped in memory"
+
+    print("  PASS: 25 messages -> 2 saves, 5 pending")
+    return True
+
+
+def test_redelivered_message_is_deduped_by_content():
+    """Test that a double delivery is processed once, but a deliberate re-send is answered."""
+    print("\n[TEST] Content dedup...")
+
+    import asyncio
+    from main import ParsedMessage
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orch = _make_orchestrator(tmpdir)
+
+        messages = [
+            ParsedMessage(1_000_000, 'group-a', '+15551111111', 'hello', []),
+            ParsedMessage(1_001_000, 'group-a', '+15551111111', 'hello', []),  # redelivered 1s later
+            ParsedMessage(1_002_000, 'group-a', '+15552222222', 'hello', []),  # different sender
+            ParsedMessage(1_020_000, 'group-a', '+15551111111', 'hello', []),  # re-sent 20s later
+        ]
+
+        async def receive():
+            return messages
+        orch.signal.receive_messages = receive
+
+        asyncio.run(orch._process_messages())
+
+        senders = [m['sender'] for m in orch.message_buffer]
+        assert senders == ['+15551111111', '+15552222222', '+15551111111'], f"Unexpected buffered messages: {senders}"
+
+    print("  PASS: 4 deliveries -> 3 messages processed (double delivery dropped, re-send kept)")
+    return True
+
+
+def test_repeated_alerts_are_broadcast():
+    """Test that identical broadcasts are suppressed, but repeated verification/observation alerts still go out."""
+    print("\n[TEST] Repeated alerts broadcast...")
+
+    import asyncio
+    import main
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orch = _make_orchestrator(tmpdir)
+        sent = []
+
+        async def send(group_id, text):
+            sent.append(text)
+        orch.signal.send_message = send
+
+        async def fake_claude(prompt, working_dir, **kwargs):
+            return "ALERT: still broken", "sonnet-1", ""
+
+        async def run():
+            await orch._broadcast("startup ok")
+            await orch._broadcast("startup ok")
+            await orch._verification_check({})
+            await orch._verification_check({})
+            await orch._sonnet_observation("significant_change", [])
+            await orch._sonnet_observation("significant_change", [])
+
+        old_call = main.call_claude_code
+        main.call_claude_code = fake_claude
+        try:
+            asyncio.run(run())
+        finally:
+            main.call_claude_code = old_call
+
+    assert sent.count("startup ok") == 1, f"Identical broadcast not suppressed: {sent}"
+    alerts = [text for text in sent if "still broken" in text]
+    assert len(alerts) == 4, f"Repeated alert was swallowed: {sent}"
+
+    print("  PASS: duplicate notice suppressed, repeated verification/observation alerts sent")
+    return True
+
+
+def test_missing_balance_key_is_cached():
+    """Test that with no OpenRouter key the None balance is cached, so sends stay on the fast path."""
+    print("\n[TEST] Missing balance key cached...")
+
+    import asyncio
+    import os
+    import main
+
+    old_key, old_cache = main._openrouter_api_key, dict(main._balance_cache)
+    old_env = os.environ.pop('OPENROUTER_API_KEY', None)
+    main._openrouter_api_key = None
+    main._balance_cache.update(value=None, ts=float('-inf'))
+    try:
+        assert asyncio.run(main.get_openrouter_balance()) is None
+        assert main._balance_cache['ts'] != float('-inf'), "No-key result wasn't cached"
+    finally:
+        main._openrouter_api_key = old_key
+        main._balance_cache.update(old_cache)
+        if old_env is not None:
+            os.environ['OPENROUTER_API_KEY'] = old_env
+
+    print("  PASS: None cached, later sends skip the lookup")
+    return True
+
+
+def test_trigger_word_matching():
+    """Test that the trigger word and @opus match as whole words, case-insensitively."""
+    print("\n[TEST] Trigger matching...")
+
+    from main import _OPUS_PATTERN
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orch = _make_orchestrator(tmpdir, trigger_word='@claude')
+
+        for text, expected in {"@Claude status?": True, "hey @claude, ping": True, "@claudette": False}.items():
+            matched = orch._trigger_pattern.search(text) is not None
+            assert matched == expected, f"Trigger match for {text!r} = {matched}, expected {expected}"
+
+    for text, expected in {"@opus fix it": True, "Opus, restart OBS": True, "an opuscule": False}.items():
+        matched = _OPUS_PATTERN.search(text) is not None
+        assert matched == expected, f"Opus match for {text!r} = {matched}, expected {expected}"
+
+    print("  PASS: whole-word, case-insensitive matches")
+    return True
+
+
+def test_log_listener_flushes_on_stop():
+    """Test that importing main starts no log thread, and stopping the listener writes out queued records."""
+    print("\n[TEST] Log listener lifecycle...")
+
+    import io
+    import logging
+    import main
+
+    assert not main._log_listener_running, "Importing main started the log listener"
+
+    buffer = io.StringIO()
+    old_stream = main._log_output.setStream(buffer)
+    try:
+        main._start_log_listener()
+        logging.getLogger('main').warning("Forcing exit")
+        main._stop_log_listener()
+        main._stop_log_listener()  # force_exit and atexit may both call it
+    finally:
+        main._log_output.setStream(old_stream)
+
+    assert "WARNING - Forcing exit" in buffer.getvalue(), f"Queued record lost: {buffer.getvalue()!r}"
+    assert main._log_output in logging.getLogger().handlers, "Direct output not restored after stop"
+
+    print("  PASS: no thread on import, queued records flushed on stop")
+    return True
+
+
+def test_shutdown_request_stops_run():
+    """Test that request_shutdown() ends run() promptly and runs the cleanup path."""
+    print("\n[TEST] Shutdown request stops run()...")
+
+    import asyncio
+    import time
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orch = _make_orchestrator(tmpdir, poll_interval=60, health_check_interval=60)
+
+        async def receive():
+            return []
+        orch.signal.receive_messages = receive
+
+        async def run():
+            asyncio.get_running_loop().call_later(0.2, orch.request_shutdown)
+            await orch.run()
+
+        start = time.time()
+        asyncio.run(run())
+        elapsed = time.time() - start
+
+        assert elapsed < 2, f"run() took {elapsed:.1f}s to stop after shutdown request"
+        assert not (Path(tmpdir) / ".running").exists(), "Running marker not cleared"
+        assert "Clean shutdown" in orch.memory.read(), "Cleanup path didn't run"
+
+    print(f"  PASS: run() returned {elapsed:.2f}s after start, cleanup ran")
+    return True
+
+
+def test_shared_sessions_are_serialized():
+    """Test that direct Opus, Sonnet escalation and auto-recovery never resume the Opus session at once."""
+    print("\n[TEST] Shared session calls serialized...")
+
+    import asyncio
+    import main
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orch = _make_orchestrator(tmpdir)
+        active = {'sonnet': 0, 'opus': 0}
+        peak = {'sonnet': 0, 'opus': 0}
+        resumed = []
+
+        async def fake_claude(prompt, working_dir, model='opus', session_id=None, **kwargs):
+            active[model] += 1
+            peak[model] = max(peak[model], active[model])
+            resumed.append((model, session_id))
+            await asyncio.sleep(0.05)
+            active[model] -= 1
+            if model == 'sonnet':
+                return "ESCALATE: needs a fix", "sonnet-1", ""
+            return "done", f"opus-{len(resumed)}", ""
+
+        async def send(group_id, text):
+            pass
+        orch.signal.send_message = send
+
+        async def run():
+            await asyncio.gather(
+                orch._answer('group-a', "opus fix it", direct_opus=True),
+                orch._answer('group-a', "is it broken?", direct_opus=False),
+                orch._attempt_auto_recovery(["obs down"]),
+            )
+
+        old_call = main.call_claude_code
+        main.call_claude_code = fake_claude
+        try:
+            asyncio.run(run())
+        finally:
+            main.call_claude_code = old_call
+
+    assert peak['opus'] == 1, f"Opus session resumed by {peak['opus']} calls at once"
+    opus_ids = [sid for model, sid in resumed if model == 'opus']
+    assert len(opus_ids) == 3 and len(set(opus_ids)) == 3, f"Opus calls should chain sessions: {opus_ids}"
+
+    print("  PASS: 3 Opus calls ran one at a time, each resuming the last")
+    return True
+
+
+def test_claude_worker_reuses_process():
+    """Test that persistent Claude workers answer repeated calls from one process."""
+    print("\n[TEST] Claude worker reuses process...")
+
+    import asyncio
+    import os
+    import stat
+    import main
+
+    if os.name == 'nt':
+        print("  SKIP: fake claude script needs a POSIX shebang")
+        return True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Fake `claude` speaking stream-json: one result per prompt line, tagged with its pid
+        script = Path(tmpdir) / "claude"
+        script.write_text(f'''#!{sys.executable}
+import json, os, sys
+session = sys.argv[sys.argv.index("--resume") + 1] if "--resume" in sys.argv else "session-1"
+for line in sys.stdin:
+    prompt = json.loads(line)["message"]["content"]
+    for item in (
+        {{"type": "system", "subtype": "init", "session_id": session}},
+        {{"type": "assistant", "message": {{"content": [{{"type": "tool_use", "name": "Read"}}]}}}},
+        {{"type": "result", "result": f"{{os.getpid()}}:{{prompt}}", "session_id": session}},
+    ):
+        print(json.dumps(item), flush=True)
+''')
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+
+        old_path, old_enabled = main._claude_path, main._claude_workers_enabled
+        main._claude_path, main._claude_workers_enabled = str(script), True
+
+        async def run():
+            try:
+                first = await main.call_claude_code("one", Path(tmpdir), model='sonnet', timeout=10)
+                second = await main.call_claude_code("two", Path(tmpdir), model='sonnet', session_id=first[1], timeout=10)
+                other = await main.call_claude_code("three", Path(tmpdir), model='sonnet', session_id="session-2", timeout=10)
+            finally:
+                await main.close_claude_workers()
+            return first, second, other
+
+        try:
+            first, second, other = asyncio.run(run())
+        finally:
+            main._claude_path, main._claude_workers_enabled = old_path, old_enabled
+
+    pid, text = first[0].split(":")
+    assert text == "one" and first[1] == "session-1", f"Unexpected first reply: {first}"
+    assert first[2] == "Read: 1", f"Tool usage not counted: {first[2]!r}"
+    assert second[0] == f"{pid}:two", f"Second call should reuse the process: {second}"
+    assert not other[0].startswith(f"{pid}:") and other[1] == "session-2", f"New session should restart worker: {other}"
+
+    print("  PASS: Same session -> same process, new session -> restarted")
+    return True
+
+
+def test_claude_worker_crash_is_not_retried():
+    """Test that a worker dying after it got the prompt returns an error instead of re-running it one-shot."""
+    print("\n[TEST] Claude worker crash not retried...")
+
+    import asyncio
+    import os
+    import stat
+    import main
+
+    if os.name == 'nt':
+        print("  SKIP: fake claude script needs a POSIX shebang")
+        return True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Fake `claude`: records every invocation, takes the prompt, then dies without a result
+        runs = Path(tmpdir) / "runs.log"
+        script = Path(tmpdir) / "claude"
+        script.write_text(f'''#!{sys.executable}
+import sys
+with open({str(runs)!r}, "a") as f:
+    f.write(" ".join(sys.argv[1:3]) + "\\n")
+sys.stdin.readline()
+sys.exit(1)
+''')
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+
+        old_path, old_enabled = main._claude_path, main._claude_workers_enabled
+        main._claude_path, main._claude_workers_enabled = str(script), True
+
+        async def run():
+            try:
+                return await main.call_claude_code("edit the file", Path(tmpdir), model='sonnet', timeout=10)
+            finally:
+                await main.close_claude_workers()
+
+        try:
+            response, session_id, _ = asyncio.run(run())
+        finally:
+            main._claude_path, main._claude_workers_enabled = old_path, old_enabled
+
+        invocations = runs.read_text().splitlines()
+
+    assert response.startswith("Error"), f"Expected an error reply, got {response!r}"
+    assert len(invocations) == 1, f"Prompt ran {len(invocations)} times: {invocations}"
+
+    print("  PASS: worker crash after delivery -> error, prompt ran once")
+    return True
+
+
 def test_claude_code_available():
     """Test that claude CLI is available."""
     print("\n[TEST] Claude Code CLI available...")
@@ -275,6 +843,22 @@ def main():
     results.append(('Session persistence', test_session_persistence()))
     results.append(('JSON parsing', test_json_parsing()))
     results.append(('ops-log.md structure', test_ops_log_structure()))
+    results.append(('ops-log batch writes', test_memory_batch_single_write()))
+    results.append(('ops-log read cache', test_memory_read_cache_and_noop_writes()))
+    results.append(('Status update trims events', test_status_update_trims_old_events()))
+    results.append(('ops-log concurrent updates', test_memory_concurrent_updates_not_lost()))
+    results.append(('Dedup cache eviction', test_dedup_cache_eviction()))
+    results.append(('Session save debounce', test_session_saves_are_debounced()))
+    results.append(('Timestamp save batching', test_timestamp_saves_are_batched()))
+    results.append(('Content dedup', test_redelivered_message_is_deduped_by_content()))
+    results.append(('Repeated alerts', test_repeated_alerts_are_broadcast()))
+    results.append(('Balance without key', test_missing_balance_key_is_cached()))
+    results.append(('Trigger matching', test_trigger_word_matching()))
+    results.append(('Log listener lifecycle', test_log_listener_flushes_on_stop()))
+    results.append(('Shutdown request', test_shutdown_request_stops_run()))
+    results.append(('Shared session locking', test_shared_sessions_are_serialized()))
+    results.append(('Claude worker reuse', test_claude_worker_reuses_process()))
+    results.append(('Claude worker crash', test_claude_worker_crash_is_not_retried()))
     results.append(('Claude CLI available', test_claude_code_available()))
 
     # Only run with --live flag
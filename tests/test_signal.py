@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Tests for the signal-cli client (SignalCLINative).
+
+Uses a fake signal-cli script so we exercise real subprocesses without
+needing Java, a linked account, or network access.
+
+Run with: python tests/test_signal.py
+"""
+
+import asyncio
+import json
+import os
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'orchestrator'))
+
+from main import SignalCLINative, strip_markdown
+
+
+def _make_fake_signal_cli(tmpdir: str) -> tuple[str, Path]:
+    """
+    Create an executable that records each invocation (argv + stdin) as a JSON line.
+
+    Returns:
+        (path to fake signal-cli, path to call log)
+    """
+    log_path = Path(tmpdir) / "calls.jsonl"
+    script_path = Path(tmpdir) / "signal-cli"
+    script_path.write_text(f'''#!{sys.executable}
+import json, sys
+
+def log(entry):
+    with open({str(log_path)!r}, "a") as f:
+        f.write(json.dumps(entry) + "\\n")
+
+if "jsonRpc" in sys.argv:
+    # Streaming mode: announce one incoming group message, then record and answer requests until EOF
+    envelope = {{"source": "+15551111111", "timestamp": 1,
+                 "dataMessage": {{"message": "hello", "groupInfo": {{"groupId": "group-a"}}}}}}
+    print(json.dumps({{"jsonrpc": "2.0", "method": "receive",
+                      "params": {{"envelope": envelope, "account": "+15550000000"}}}}), flush=True)
+    for line in sys.stdin:
+        request = json.loads(line)
+        log({{"argv": sys.argv[1:], "rpc": request}})
+        print(json.dumps({{"jsonrpc": "2.0", "id": request["id"], "result": {{"timestamp": 2}}}}), flush=True)
+else:
+    stdin = sys.stdin.read() if "--message-from-stdin" in sys.argv else ""
+    log({{"argv": sys.argv[1:], "stdin": stdin}})
+''')
+    script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
+    return str(script_path), log_path
+
+
+def _read_calls(log_path: Path) -> list[dict]:
+    if not log_path.exists():
+        return []
+    return [json.loads(line) for line in log_path.read_text().splitlines() if line]
+
+
+def test_send_burst_is_coalesced():
+    """A burst of sends to one group should spawn signal-cli once, not per message."""
+    print("\n[TEST] Send burst coalescing...")
+
+    if os.name == 'nt':
+        print("  SKIP: fake signal-cli script needs a POSIX shebang")
+        return True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cli_path, log_path = _make_fake_signal_cli(tmpdir)
+        client = SignalCLINative(signal_cli_path=cli_path)
+        client.configure("+15550000000", ["group-a", "group-b"])
+
+        async def run():
+            await asyncio.gather(
+                client.send_message("group-a", "first"),
+                client.send_message("group-a", "second"),
+                client.send_message("group-a", "third"),
+                client.send_message("group-b", "other group"),
+            )
+
+        asyncio.run(run())
+        calls = _read_calls(log_path)
+
+    assert len(calls) == 2, f"Expected 2 signal-cli calls (one per group), got {len(calls)}"
+
+    by_group = {call['argv'][call['argv'].index('-g') + 1]: call['stdin'] for call in calls}
+    assert by_group['group-a'] == "first\n\nsecond\n\nthird", f"Unexpected batch: {by_group['group-a']!r}"
+    assert by_group['group-b'] == "other group", f"Unexpected batch: {by_group['group-b']!r}"
+
+    print("  PASS: 4 sends across 2 groups -> 2 signal-cli calls")
+    return True
+
+
+def test_coalesce_respects_length_limit():
+    """Coalescing must not glue messages past Signal's length limit."""
+    print("\n[TEST] Coalescing respects length limit...")
+
+    client = SignalCLINative()
+    big = "x" * 2500
+    batches = client._coalesce([big, big, "tail"])
+
+    assert len(batches) == 2, f"Expected 2 batches, got {len(batches)}"
+    assert all(len(b) <= client.MAX_MESSAGE_LENGTH for b in batches), "Batch exceeded limit"
+    assert batches[1] == f"{big}\n\ntail", "Second batch should carry the remainder"
+
+    print("  PASS: Oversized bursts split into multiple sends")
+    return True
+
+
+def test_streaming_receive_and_send():
+    """Streaming mode: one jsonRpc process delivers messages and carries sends."""
+    print("\n[TEST] Streaming receive and send...")
+
+    if os.name == 'nt':
+        print("  SKIP: fake signal-cli script needs a POSIX shebang")
+        return True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cli_path, log_path = _make_fake_signal_cli(tmpdir)
+        client = SignalCLINative(signal_cli_path=cli_path)
+        client.configure("+15550000000", ["group-a"], streaming=True)
+
+        async def run():
+            await client.start()
+            try:
+                messages = await client.receive_messages()
+                await client.send_message("group-a", "reply")
+            finally:
+                await client.close()
+            return messages
+
+        messages = asyncio.run(run())
+        calls = _read_calls(log_path)
+
+    assert len(messages) == 1, f"Expected 1 streamed message, got {len(messages)}"
+    parsed = client.extract_group_message(messages[0])
+    assert parsed and parsed[2] == "hello", f"Streamed envelope not parseable: {messages[0]}"
+
+    assert len(calls) == 1 and 'rpc' in calls[0], f"Send should go over the jsonRpc process: {calls}"
+    rpc = calls[0]['rpc']
+    assert rpc['method'] == 'send', f"Unexpected RPC method: {rpc['method']}"
+    assert rpc['params'] == {"groupId": "group-a", "message": "reply"}, f"Unexpected params: {rpc['params']}"
+
+    print("  PASS: Message streamed in, reply sent over the same process")
+    return True
+
+
+def test_streaming_survives_bad_lines():
+    """Malformed, non-object and oversized lines are skipped without restarting signal-cli."""
+    print("\n[TEST] Streaming survives bad lines...")
+
+    if os.name == 'nt':
+        print("  SKIP: fake signal-cli script needs a POSIX shebang")
+        return True
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        starts = Path(tmpdir) / "starts.log"
+        script = Path(tmpdir) / "signal-cli"
+        script.write_text(f'''#!{sys.executable}
+import json, sys
+with open({str(starts)!r}, "a") as f:
+    f.write("start\\n")
+envelope = {{"source": "+15551111111", "timestamp": 1,
+             "dataMessage": {{"message": "hello", "groupInfo": {{"groupId": "group-a"}}}}}}
+print("not json", flush=True)
+print("[1, 2]", flush=True)
+print("x" * (2 ** 20 + 10), flush=True)
+print(json.dumps({{"jsonrpc": "2.0", "method": "receive", "params": {{"envelope": envelope}}}}), flush=True)
+sys.stdin.read()
+''')
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+
+        client = SignalCLINative(signal_cli_path=str(script))
+        client.configure("+15550000000", ["group-a"], streaming=True)
+
+        async def run():
+            await client.start()
+            try:
+                return await client.receive_messages()
+            finally:
+                await client.close()
+
+        messages = asyncio.run(run())
+        start_count = len(starts.read_text().splitlines())
+
+    assert len(messages) == 1 and messages[0].text == "hello", f"Message after bad lines lost: {messages}"
+    assert start_count == 1, f"signal-cli restarted {start_count - 1} times over bad lines"
+
+    print("  PASS: bad lines skipped, same process delivered the message")
+    return True
+
+
+def test_streaming_falls_back_to_polling():
+    """If signal-cli jsonRpc can't start, the client goes back to polling instead of going deaf."""
+    print("\n[TEST] Streaming falls back to polling...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client = SignalCLINative(signal_cli_path=str(Path(tmpdir) / "no-such-signal-cli"))
+        client.configure("+15550000000", ["group-a"], streaming=True)
+        client.STREAM_RESTART_DELAY = 0
+
+        async def run():
+            await client.start()
+            await asyncio.wait_for(client._stream_task, timeout=5)
+
+        asyncio.run(run())
+
+    assert not client.streaming, "Client should have fallen back to polling"
+    print(f"  PASS: Gave up after {client.STREAM_MAX_FAILURES} failed starts, polling again")
+    return True
+
+
+def test_strip_markdown():
+    """Markdown markers are removed; plain text and snake_case survive."""
+    print("\n[TEST] Markdown stripping...")
+
+    cases = {
+        "**bold** and __bold__": "bold and bold",
+        "*italic* and _italic_": "italic and italic",
+        "run `make test`": "run make test",
+        "## Status\nall good": "Status\nall good",
+        "**_nested_**": "nested",
+        "gpu_temp is fine": "gpu_temp is fine",
+        "no markdown here": "no markdown here",
+    }
+    for text, expected in cases.items():
+        result = strip_markdown(text)
+        assert result == expected, f"strip_markdown({text!r}) = {result!r}, expected {expected!r}"
+
+    print(f"  PASS: {len(cases)} cases")
+    return True
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Signal Client Tests")
+    print("=" * 60)
+
+    results = []
+    results.append(('Send burst coalescing', test_send_burst_is_coalesced()))
+    results.append(('Coalesce length limit', test_coalesce_respects_length_limit()))
+    results.append(('Streaming receive and send', test_streaming_receive_and_send()))
+    results.append(('Streaming bad lines', test_streaming_survives_bad_lines()))
+    results.append(('Streaming fallback', test_streaming_falls_back_to_polling()))
+    results.append(('Markdown stripping', test_strip_markdown()))
+
+    print("\n" + "=" * 60)
+    print("RESULTS:")
+    print("=" * 60)
+
+    passed = sum(1 for _, r in results if r)
+    total = len(results)
+
+    for name, result in results:
+        status = "PASS" if result else "FAIL"
+        print(f"  [{status}] {name}")
+
+    print(f"\n{passed}/{total} tests passed")
+
+    return 0 if passed == total else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())